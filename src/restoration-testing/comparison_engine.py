@@ -6,18 +6,69 @@ for backup verification, including content integrity checks, metadata comparison
 and performance-optimized processing for large datasets.
 """
 
+import errno
+import functools
+import gzip
 import hashlib
+import json
 import logging
+import mmap
 import os
+import queue
+import re
+import sys
+import tempfile
+import threading
 import time
+import weakref
+from collections import Counter, defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Union, Iterator
+from typing import Dict, Iterable, List, Literal, Optional, Set, Tuple, Union, Iterator
 import fnmatch
 import stat
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Aligned buffer size for O_DIRECT reads (must be a multiple of the device block size)
+DIRECT_IO_CHUNK_SIZE = 1024 * 1024
+_O_DIRECT = getattr(os, 'O_DIRECT', 0)
+_HAS_FADVISE = hasattr(os, 'posix_fadvise')
+
+# Minimum read size for xxh3, which hashes far faster than small reads return
+XXH3_CHUNK_SIZE = 1024 * 1024
+
+# Supported checksum algorithms, ranked weakest to strongest. xxh3 is a fast
+# non-cryptographic integrity check; sha256 is the reference algorithm.
+_HASH_STRENGTH = {'xxh3': 0, 'blake3': 1, 'sha256': 2}
+
+# Differences kept in memory per result before spilling to disk, and the
+# number of differences per type shown in reports
+MAX_DIFFERENCES_IN_MEMORY = 10000
+REPORT_PREVIEW_LIMIT = 10
+
+# Entries handed from a walker thread to the merging thread per queue put
+WALK_BATCH_SIZE = 1024
+
+# Bytes compared at the head and tail of a file before hashing it in full
+SAMPLE_COMPARE_SIZE = 64 * 1024
+
 
 class ComparisonMode(Enum):
     """Comparison modes for different verification strategies."""
@@ -39,6 +90,13 @@ class DifferenceType(Enum):
     TYPE_MISMATCH = "type_mismatch"
 
 
+# Display labels, precomputed once instead of formatted per difference
+_DIFF_LABELS: Dict[DifferenceType, str] = {
+    t: t.value.upper().replace('_', ' ') for t in DifferenceType
+}
+_MODE_LABEL: Dict[ComparisonMode, str] = {m: m.value for m in ComparisonMode}
+
+
 @dataclass
 class FileMetadata:
     """File metadata container."""
@@ -50,6 +108,7 @@ class FileMetadata:
     is_dir: bool
     is_symlink: bool
     checksum: Optional[str] = None
+    checksum_algo: Optional[str] = None
 
 
 @dataclass
@@ -62,6 +121,80 @@ class FileDifference:
     details: str = ""
 
 
+class DiffSink:
+    """
+    Append-only spill file for FileDifference records.
+    
+    Records are written as gzip-compressed JSON lines. Only the path, type and
+    details of each difference are kept; file metadata is not spilled. The
+    file is removed when the sink is garbage collected or remove() is called.
+    """
+    
+    def __init__(self, directory: Optional[Path] = None):
+        """
+        Initialize the sink with a fresh temporary spill file.
+        
+        Args:
+            directory: Directory for the spill file. Uses system temp if None.
+        """
+        fd, path = tempfile.mkstemp(prefix='comparison_diffs_', suffix='.jsonl.gz', dir=directory)
+        os.close(fd)
+        self.path = Path(path)
+        self.count = 0
+        self._stream: Optional[gzip.GzipFile] = None
+        self._finalizer = weakref.finalize(self, DiffSink._unlink, str(self.path))
+    
+    @staticmethod
+    def _unlink(path: str) -> None:
+        """Delete the spill file if it still exists."""
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+    
+    @staticmethod
+    def _dumps(record: Dict[str, str]) -> bytes:
+        """Serialize a record to compact JSON bytes."""
+        if orjson is not None:
+            return orjson.dumps(record)
+        return json.dumps(record, separators=(',', ':')).encode('utf-8')
+    
+    def append(self, diff: FileDifference) -> None:
+        """Write a difference to the spill file."""
+        if self._stream is None:
+            # Appending after close() starts a new gzip member, which readers handle
+            self._stream = gzip.open(self.path, 'ab', compresslevel=1)
+        self._stream.write(self._dumps({
+            'path': str(diff.path),
+            'type': diff.difference_type.value,
+            'details': diff.details,
+        }) + b'\n')
+        self.count += 1
+    
+    def close(self) -> None:
+        """Finalize the gzip stream so the spill file can be read back."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+    
+    def remove(self) -> None:
+        """Close and delete the spill file."""
+        self.close()
+        self._finalizer()
+    
+    def __iter__(self) -> Iterator[FileDifference]:
+        """Read spilled differences back in the order they were written."""
+        self.close()
+        with gzip.open(self.path, 'rb') as f:
+            for line in f:
+                record = json.loads(line)
+                yield FileDifference(
+                    path=Path(record['path']),
+                    difference_type=DifferenceType(record['type']),
+                    details=record['details']
+                )
+
+
 @dataclass
 class ComparisonResult:
     """Comprehensive comparison result with detailed metrics."""
@@ -79,6 +212,12 @@ class ComparisonResult:
     total_bytes_processed: int = 0
     excluded_patterns: List[str] = field(default_factory=list)
     errors: List[str] = field(default_factory=list)
+    max_differences_in_memory: int = MAX_DIFFERENCES_IN_MEMORY
+    difference_counts: Counter = field(default_factory=Counter)
+    difference_previews: Dict[DifferenceType, List[FileDifference]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    _diff_sink: Optional[DiffSink] = field(default=None, repr=False)
     
     @property
     def success_rate(self) -> float:
@@ -90,7 +229,58 @@ class ComparisonResult:
     @property
     def has_differences(self) -> bool:
         """Check if any differences were found."""
-        return len(self.differences) > 0
+        return bool(self.difference_counts)
+    
+    @property
+    def total_differences(self) -> int:
+        """Total number of differences, including those spilled to disk."""
+        return sum(self.difference_counts.values())
+    
+    def add_difference(self, diff: FileDifference) -> None:
+        """
+        Record a difference.
+        
+        The first max_differences_in_memory differences are kept in
+        self.differences; the rest are spilled to a temporary file. Totals and
+        per-type report previews are always kept in memory.
+        
+        Args:
+            diff: Difference to record
+        """
+        diff_type = diff.difference_type
+        self.difference_counts[diff_type] += 1
+        
+        preview = self.difference_previews[diff_type]
+        if len(preview) < REPORT_PREVIEW_LIMIT:
+            preview.append(diff)
+        
+        if len(self.differences) < self.max_differences_in_memory:
+            self.differences.append(diff)
+        else:
+            if self._diff_sink is None:
+                self._diff_sink = DiffSink()
+            self._diff_sink.append(diff)
+    
+    def add_differences(self, diffs: Iterable[FileDifference]) -> None:
+        """Record several differences."""
+        for diff in diffs:
+            self.add_difference(diff)
+    
+    def iter_differences(self) -> Iterator[FileDifference]:
+        """
+        Iterate over all differences, reading spilled ones back from disk.
+        
+        Spilled differences carry path, type and details but no metadata.
+        """
+        yield from self.differences
+        if self._diff_sink is not None:
+            yield from self._diff_sink
+    
+    def close(self) -> None:
+        """Remove the spill file, if any."""
+        if self._diff_sink is not None:
+            self._diff_sink.remove()
+            self._diff_sink = None
     
     def get_summary(self) -> str:
         """Generate a human-readable summary of the comparison."""
@@ -98,7 +288,7 @@ class ComparisonResult:
             f"Comparison Summary:\n"
             f"  Source: {self.source_path}\n"
             f"  Target: {self.target_path}\n"
-            f"  Mode: {self.comparison_mode.value}\n"
+            f"  Mode: {_MODE_LABEL[self.comparison_mode]}\n"
             f"  Files Processed: {self.total_files_processed}\n"
             f"  Directories Processed: {self.total_directories_processed}\n"
             f"  Identical Files: {self.files_identical}\n"
@@ -112,6 +302,116 @@ class ComparisonResult:
         )
 
 
+# Source fragments for mode-specialized comparators. Each ComparisonMode gets a
+# function containing only the checks it needs, so the per-file hot path has no
+# mode branches or enum comparisons left in it.
+_CMP_HEAD = """
+def compare(source_metadata, target_metadata):
+"""
+
+_CMP_QUICK_GATE = """
+    if source_metadata.size == target_metadata.size:
+        return []
+"""
+
+_CMP_TYPE = """
+    differences = []
+    if (source_metadata.is_file != target_metadata.is_file or
+            source_metadata.is_dir != target_metadata.is_dir):
+        differences.append(FileDifference(
+            path=source_metadata.path,
+            difference_type=DifferenceType.TYPE_MISMATCH,
+            source_metadata=source_metadata,
+            target_metadata=target_metadata,
+            details=f"Type mismatch: source={'file' if source_metadata.is_file else 'dir'}, "
+                    f"target={'file' if target_metadata.is_file else 'dir'}"
+        ))
+        return differences
+"""
+
+_CMP_SIZE = """
+    if source_metadata.size != target_metadata.size:
+        differences.append(FileDifference(
+            path=source_metadata.path,
+            difference_type=DifferenceType.SIZE_MISMATCH,
+            source_metadata=source_metadata,
+            target_metadata=target_metadata,
+            details=f"Size mismatch: source={source_metadata.size}, target={target_metadata.size}"
+        ))
+"""
+
+_CMP_CHECKSUM = """
+    if (source_metadata.is_file and target_metadata.is_file and
+            source_metadata.checksum and target_metadata.checksum and
+            source_metadata.checksum != target_metadata.checksum):
+        differences.append(FileDifference(
+            path=source_metadata.path,
+            difference_type=DifferenceType.CONTENT_MISMATCH,
+            source_metadata=source_metadata,
+            target_metadata=target_metadata,
+            details="Content mismatch: checksums differ"
+        ))
+"""
+
+_CMP_FULL = """
+    source_perms = S_IMODE(source_metadata.mode)
+    target_perms = S_IMODE(target_metadata.mode)
+    if source_perms != target_perms:
+        differences.append(FileDifference(
+            path=source_metadata.path,
+            difference_type=DifferenceType.PERMISSION_MISMATCH,
+            source_metadata=source_metadata,
+            target_metadata=target_metadata,
+            details=f"Permission mismatch: source={oct(source_perms)}, target={oct(target_perms)}"
+        ))
+    if abs(source_metadata.mtime - target_metadata.mtime) > 1.0:
+        differences.append(FileDifference(
+            path=source_metadata.path,
+            difference_type=DifferenceType.TIMESTAMP_MISMATCH,
+            source_metadata=source_metadata,
+            target_metadata=target_metadata,
+            details=f"Timestamp mismatch: source={source_metadata.mtime}, "
+                    f"target={target_metadata.mtime}"
+        ))
+"""
+
+_CMP_TAIL = """
+    return differences
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_comparator(mode: ComparisonMode, size_gate: bool = False):
+    """
+    Build a metadata comparator specialized for a comparison mode.
+    
+    Args:
+        mode: Comparison mode to specialize for
+        size_gate: In QUICK mode, skip all checks when sizes match
+        
+    Returns:
+        Function taking (source_metadata, target_metadata) and returning
+        a list of FileDifference
+    """
+    parts = [_CMP_HEAD]
+    if size_gate and mode == ComparisonMode.QUICK:
+        parts.append(_CMP_QUICK_GATE)
+    parts.extend([_CMP_TYPE, _CMP_SIZE])
+    if mode in (ComparisonMode.FULL, ComparisonMode.CHECKSUM_ONLY):
+        parts.append(_CMP_CHECKSUM)
+    if mode == ComparisonMode.FULL:
+        parts.append(_CMP_FULL)
+    parts.append(_CMP_TAIL)
+    
+    namespace = {
+        'FileDifference': FileDifference,
+        'DifferenceType': DifferenceType,
+        'S_IMODE': stat.S_IMODE,
+    }
+    exec(compile(''.join(parts), f"<comparator:{mode.value}>", 'exec'), namespace)
+    return namespace['compare']
+
+
 class ComparisonEngine:
     """
     High-performance content comparison engine for backup verification.
@@ -126,7 +426,12 @@ class ComparisonEngine:
         chunk_size: int = 8192,
         exclude_patterns: Optional[List[str]] = None,
         follow_symlinks: bool = False,
-        case_sensitive: bool = True
+        case_sensitive: bool = True,
+        direct_io: bool = False,
+        hash_algo: Literal['sha256', 'blake3', 'xxh3'] = 'xxh3',
+        max_differences_in_memory: int = MAX_DIFFERENCES_IN_MEMORY,
+        prefetch_depth: int = 4,
+        sample_compare: bool = True
     ):
         """
         Initialize the comparison engine.
@@ -137,38 +442,134 @@ class ComparisonEngine:
             exclude_patterns: List of glob patterns to exclude from comparison
             follow_symlinks: Whether to follow symbolic links
             case_sensitive: Whether path comparison is case-sensitive
+            direct_io: Read files with O_DIRECT (Linux) to bypass the page cache
+            hash_algo: Checksum algorithm ('sha256', 'blake3' or 'xxh3'); falls back
+                to sha256 when the library for the requested algorithm is missing
+            max_differences_in_memory: Differences kept in memory per result before
+                spilling the rest to disk
+            prefetch_depth: How many file pairs beyond those already being hashed
+                to request kernel readahead for (0 disables prefetching)
+            sample_compare: In FULL mode, compare the leading and trailing bytes of
+                same-size files before hashing and report a mismatch without
+                hashing when they differ. Disable for strict verification.
         """
         self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
         self.chunk_size = chunk_size
         self.exclude_patterns = exclude_patterns or []
+        self._exclude_cache: Tuple[Tuple[str, ...], Optional['re.Pattern[str]']] = ((), None)
         self.follow_symlinks = follow_symlinks
         self.case_sensitive = case_sensitive
+        self.direct_io = direct_io and bool(_O_DIRECT)
+        self.max_differences_in_memory = max_differences_in_memory
+        self.prefetch_depth = prefetch_depth if _HAS_FADVISE else 0
+        self.sample_compare = sample_compare
         self.logger = logging.getLogger(__name__)
+        
+        if hash_algo not in _HASH_STRENGTH:
+            raise ValueError(f"Unsupported hash algorithm: {hash_algo}")
+        if (hash_algo == 'xxh3' and xxhash is None) or (hash_algo == 'blake3' and blake3 is None):
+            self.logger.info(f"{hash_algo} is not installed, falling back to sha256")
+            hash_algo = 'sha256'
+        self.hash_algo = hash_algo
+        self._read_buffers = threading.local()
     
-    def calculate_checksum(self, file_path: Path) -> str:
+    @staticmethod
+    def _new_hasher(algo: str):
+        """Create a fresh hash object for the given algorithm."""
+        if algo == 'xxh3':
+            return xxhash.xxh3_128()
+        if algo == 'blake3':
+            return blake3.blake3()
+        return hashlib.sha256()
+    
+    def calculate_checksum(self, file_path: Path, algo: Optional[str] = None) -> str:
         """
-        Calculate SHA-256 checksum for a file using streaming.
+        Calculate a file checksum using streaming.
+        
+        Pages read for hashing are dropped from the page cache afterwards so
+        that verifying trees larger than RAM does not evict sibling files.
         
         Args:
             file_path: Path to the file
+            algo: Checksum algorithm, defaults to the engine's hash_algo
             
         Returns:
-            Hexadecimal SHA-256 checksum
+            Hexadecimal checksum
             
         Raises:
             IOError: If file cannot be read
         """
-        sha256_hash = hashlib.sha256()
+        algo = algo or self.hash_algo
         
         try:
+            if self.direct_io:
+                try:
+                    return self._calculate_checksum_direct(file_path, self._new_hasher(algo))
+                except OSError as e:
+                    # Filesystems such as tmpfs reject O_DIRECT; use buffered reads
+                    if e.errno != errno.EINVAL:
+                        raise
+            
+            hasher = self._new_hasher(algo)
             with open(file_path, 'rb') as f:
-                while chunk := f.read(self.chunk_size):
-                    sha256_hash.update(chunk)
-            return sha256_hash.hexdigest()
+                fd = f.fileno()
+                if _HAS_FADVISE:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                if algo == 'xxh3':
+                    # Per-read overhead would dominate xxh3, so read large blocks
+                    # into a per-thread buffer that is reused across files
+                    buf = self._read_buffer(max(self.chunk_size, XXH3_CHUNK_SIZE))
+                    with memoryview(buf) as view:
+                        while n := f.readinto(buf):
+                            hasher.update(view[:n])
+                else:
+                    while chunk := f.read(self.chunk_size):
+                        hasher.update(chunk)
+                if _HAS_FADVISE:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            return hasher.hexdigest()
         except Exception as e:
             self.logger.error(f"Error calculating checksum for {file_path}: {e}")
             raise IOError(f"Cannot calculate checksum for {file_path}: {e}")
     
+    def _read_buffer(self, size: int) -> bytearray:
+        """
+        Get this thread's reusable read buffer, growing it to at least size.
+        
+        Args:
+            size: Minimum buffer size in bytes
+            
+        Returns:
+            Buffer private to the calling thread
+        """
+        buf = getattr(self._read_buffers, 'buf', None)
+        if buf is None or len(buf) < size:
+            buf = self._read_buffers.buf = bytearray(size)
+        return buf
+    
+    def _calculate_checksum_direct(self, file_path: Path, hasher) -> str:
+        """
+        Calculate a file checksum reading through O_DIRECT.
+        
+        Reads go into a page-aligned anonymous mapping, so the working set stays
+        bounded to max_workers x DIRECT_IO_CHUNK_SIZE regardless of file size.
+        
+        Args:
+            file_path: Path to the file
+            hasher: Fresh hash object to feed
+            
+        Returns:
+            Hexadecimal checksum
+        """
+        fd = os.open(file_path, os.O_RDONLY | _O_DIRECT)
+        try:
+            with mmap.mmap(-1, DIRECT_IO_CHUNK_SIZE) as buf, memoryview(buf) as view:
+                while n := os.readv(fd, [buf]):
+                    hasher.update(view[:n])
+        finally:
+            os.close(fd)
+        return hasher.hexdigest()
+    
     def get_file_metadata(self, file_path: Path, include_checksum: bool = True) -> FileMetadata:
         """
         Extract comprehensive metadata for a file or directory.
@@ -195,6 +596,7 @@ class ComparisonEngine:
             
             if include_checksum and metadata.is_file and not metadata.is_symlink:
                 metadata.checksum = self.calculate_checksum(file_path)
+                metadata.checksum_algo = self.hash_algo
             
             return metadata
             
@@ -202,7 +604,30 @@ class ComparisonEngine:
             self.logger.error(f"Error getting metadata for {file_path}: {e}")
             raise
     
-    def should_exclude(self, path: Path) -> bool:
+    def _exclude_regex(self) -> Optional['re.Pattern[str]']:
+        """
+        Get the exclude patterns compiled into a single regular expression.
+        
+        The compiled form is cached and rebuilt if exclude_patterns changes.
+        
+        Returns:
+            Compiled pattern, or None if there is nothing to exclude
+        """
+        patterns = tuple(self.exclude_patterns)
+        if patterns != self._exclude_cache[0]:
+            regex = None
+            if patterns:
+                if not self.case_sensitive:
+                    patterns_norm = [p.lower() for p in patterns]
+                else:
+                    patterns_norm = list(patterns)
+                regex = re.compile('|'.join(
+                    fnmatch.translate(os.path.normcase(p)) for p in patterns_norm
+                ))
+            self._exclude_cache = (patterns, regex)
+        return self._exclude_cache[1]
+    
+    def should_exclude(self, path: Union[str, Path]) -> bool:
         """
         Check if a path should be excluded based on patterns.
         
@@ -212,52 +637,139 @@ class ComparisonEngine:
         Returns:
             True if path should be excluded
         """
+        regex = self._exclude_regex()
+        if regex is None:
+            return False
+        
         path_str = str(path)
         if not self.case_sensitive:
             path_str = path_str.lower()
+        return regex.match(os.path.normcase(path_str)) is not None
+    
+    def _iter_entries(self, root_str: str) -> Iterator[Tuple[str, os.DirEntry]]:
+        """
+        Walk a directory tree, yielding entries that are not excluded.
         
-        for pattern in self.exclude_patterns:
-            if not self.case_sensitive:
-                pattern = pattern.lower()
-            if fnmatch.fnmatch(path_str, pattern):
-                return True
-        return False
+        Args:
+            root_str: Root directory to scan
+            
+        Yields:
+            Tuples of (relative_key, dir_entry)
+        """
+        # scandir joins names onto the root string, so every entry path starts
+        # with the root plus exactly one separator (or none if root ends in one)
+        prefix_len = len(os.path.join(root_str, ''))
+        pending = [root_str]
+        while pending:
+            directory = pending.pop()
+            try:
+                entries = os.scandir(directory)
+            except PermissionError:
+                # Same as rglob: unreadable directories are skipped
+                self.logger.debug(f"Skipping unreadable directory: {directory}")
+                continue
+            
+            with entries:
+                for entry in entries:
+                    # Like rglob, never descend through directory symlinks
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    
+                    if self.should_exclude(entry.path):
+                        continue
+                    
+                    if not self.follow_symlinks and entry.is_symlink():
+                        continue
+                    
+                    key = entry.path[prefix_len:]
+                    if not self.case_sensitive:
+                        key = key.lower()
+                    yield sys.intern(key), entry
     
-    def collect_files(self, root_path: Path) -> Dict[str, Path]:
+    def collect_files(self, root_path: Path) -> Dict[str, str]:
         """
         Collect all files in a directory tree with relative paths as keys.
         
+        Keys are interned so set operations between two trees mostly compare by
+        identity; values are plain strings and only become Path objects at the
+        I/O boundary.
+        
         Args:
             root_path: Root directory to scan
             
         Returns:
-            Dictionary mapping relative paths to absolute paths
+            Dictionary mapping relative paths to absolute path strings
         """
-        files = {}
-        
         try:
-            for item in root_path.rglob('*'):
-                if self.should_exclude(item):
-                    continue
-                
-                if not self.follow_symlinks and item.is_symlink():
-                    continue
-                
-                try:
-                    relative_path = item.relative_to(root_path)
-                    key = str(relative_path)
-                    if not self.case_sensitive:
-                        key = key.lower()
-                    files[key] = item
-                except ValueError:
-                    # Skip files outside the root path
-                    continue
-                    
+            return {key: entry.path for key, entry in self._iter_entries(os.fspath(root_path))}
         except Exception as e:
             self.logger.error(f"Error collecting files from {root_path}: {e}")
             raise
+    
+    def collect_file_pairs(
+        self,
+        source_path: Union[str, Path],
+        target_path: Union[str, Path]
+    ) -> Dict[str, List[Optional[str]]]:
+        """
+        Walk the source and target trees concurrently into one merged mapping.
+        
+        Each tree is walked on its own thread so the two I/O streams overlap,
+        and the entries are merged as they arrive so only one dictionary is
+        ever built.
+        
+        Args:
+            source_path: Source directory to scan
+            target_path: Target directory to scan
+            
+        Returns:
+            Dictionary mapping relative paths to [source_path, target_path];
+            a side is None when the path does not exist in that tree
+        """
+        batches: queue.Queue = queue.Queue(maxsize=64)
+        
+        def walk(side: int, root: Union[str, Path]) -> None:
+            try:
+                batch = []
+                for key, entry in self._iter_entries(os.fspath(root)):
+                    batch.append((key, entry.path))
+                    if len(batch) >= WALK_BATCH_SIZE:
+                        batches.put((side, batch))
+                        batch = []
+                batches.put((side, batch))
+                batches.put((side, None))
+            except Exception as e:
+                batches.put((side, e))
+        
+        walkers = [
+            threading.Thread(target=walk, args=(side, root), daemon=True)
+            for side, root in enumerate((source_path, target_path))
+        ]
+        for walker in walkers:
+            walker.start()
+        
+        merged: Dict[str, List[Optional[str]]] = defaultdict(lambda: [None, None])
+        error: Optional[Exception] = None
+        running = len(walkers)
+        while running:
+            side, batch = batches.get()
+            if batch is None:
+                running -= 1
+            elif isinstance(batch, Exception):
+                error = error or batch
+                running -= 1
+            else:
+                for key, path in batch:
+                    merged[key][side] = path
+        
+        for walker in walkers:
+            walker.join()
         
-        return files
+        if error is not None:
+            self.logger.error(f"Error collecting files from {source_path} and {target_path}: {error}")
+            raise error
+        
+        return dict(merged)
     
     def compare_metadata(
         self,
@@ -276,74 +788,113 @@ class ComparisonEngine:
         Returns:
             List of differences found
         """
-        differences = []
+        if (source_metadata.checksum and target_metadata.checksum and
+                source_metadata.checksum_algo != target_metadata.checksum_algo):
+            self._reconcile_checksums(source_metadata, target_metadata)
         
-        # Check file type consistency
-        if (source_metadata.is_file != target_metadata.is_file or
-            source_metadata.is_dir != target_metadata.is_dir):
-            differences.append(FileDifference(
-                path=source_metadata.path,
-                difference_type=DifferenceType.TYPE_MISMATCH,
-                source_metadata=source_metadata,
-                target_metadata=target_metadata,
-                details=f"Type mismatch: source={'file' if source_metadata.is_file else 'dir'}, "
-                       f"target={'file' if target_metadata.is_file else 'dir'}"
-            ))
-            return differences  # No point in further comparison
+        return _compile_comparator(mode)(source_metadata, target_metadata)
+    
+    def _reconcile_checksums(self, source_metadata: FileMetadata, target_metadata: FileMetadata) -> None:
+        """
+        Re-hash metadata whose checksum algorithm differs from its counterpart.
         
-        # Size comparison
-        if source_metadata.size != target_metadata.size:
-            differences.append(FileDifference(
-                path=source_metadata.path,
-                difference_type=DifferenceType.SIZE_MISMATCH,
-                source_metadata=source_metadata,
-                target_metadata=target_metadata,
-                details=f"Size mismatch: source={source_metadata.size}, target={target_metadata.size}"
-            ))
+        Both sides are brought to the stronger of the two algorithms so that
+        differing algorithms are not reported as a content mismatch.
         
-        # Content comparison (checksum)
-        if (mode in [ComparisonMode.FULL, ComparisonMode.CHECKSUM_ONLY] and
-            source_metadata.is_file and target_metadata.is_file and
-            source_metadata.checksum and target_metadata.checksum and
-            source_metadata.checksum != target_metadata.checksum):
-            differences.append(FileDifference(
-                path=source_metadata.path,
-                difference_type=DifferenceType.CONTENT_MISMATCH,
-                source_metadata=source_metadata,
-                target_metadata=target_metadata,
-                details=f"Content mismatch: checksums differ"
-            ))
+        Args:
+            source_metadata: Source file metadata
+            target_metadata: Target file metadata
+        """
+        algos = (source_metadata.checksum_algo or 'sha256', target_metadata.checksum_algo or 'sha256')
+        stronger = max(algos, key=lambda a: _HASH_STRENGTH.get(a, 0))
+        self.logger.info(
+            f"Checksum algorithms differ for {source_metadata.path} ({algos[0]} vs {algos[1]}), "
+            f"re-hashing with {stronger}"
+        )
         
-        # Permission comparison
-        if mode == ComparisonMode.FULL:
-            if stat.S_IMODE(source_metadata.mode) != stat.S_IMODE(target_metadata.mode):
-                differences.append(FileDifference(
-                    path=source_metadata.path,
-                    difference_type=DifferenceType.PERMISSION_MISMATCH,
-                    source_metadata=source_metadata,
-                    target_metadata=target_metadata,
-                    details=f"Permission mismatch: source={oct(stat.S_IMODE(source_metadata.mode))}, "
-                           f"target={oct(stat.S_IMODE(target_metadata.mode))}"
-                ))
+        for metadata in (source_metadata, target_metadata):
+            if (metadata.checksum_algo or 'sha256') != stronger:
+                metadata.checksum = self.calculate_checksum(metadata.path, stronger)
+                metadata.checksum_algo = stronger
+    
+    @staticmethod
+    def _prefetch(*paths: str) -> None:
+        """
+        Ask the kernel to start reading files into the page cache.
+        
+        POSIX_FADV_WILLNEED queues asynchronous readahead, so source and target
+        devices keep their queues full while the current pair is being hashed.
+        
+        Args:
+            paths: Paths of the files to prefetch
+        """
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+    
+    def _compare_with_prefetch(
+        self,
+        pairs: List[Tuple[str, str, str]],
+        index: int,
+        mode: ComparisonMode
+    ) -> Tuple[List[FileDifference], int]:
+        """
+        Compare pairs[index] after prefetching a pair further ahead.
+        
+        Up to max_workers pairs are compared at once, so the nearer pairs are
+        usually being read already; the hint goes to the pair prefetch_depth
+        past that window.
+        
+        Args:
+            pairs: Ordered (relative_path, source_path, target_path) tuples
+            index: Index of the pair to compare
+            mode: Comparison mode
             
-            # Timestamp comparison (with 1-second tolerance)
-            if abs(source_metadata.mtime - target_metadata.mtime) > 1.0:
-                differences.append(FileDifference(
-                    path=source_metadata.path,
-                    difference_type=DifferenceType.TIMESTAMP_MISMATCH,
-                    source_metadata=source_metadata,
-                    target_metadata=target_metadata,
-                    details=f"Timestamp mismatch: source={source_metadata.mtime}, "
-                           f"target={target_metadata.mtime}"
-                ))
+        Returns:
+            Tuple of (differences_list, bytes_processed)
+        """
+        ahead = index + self.max_workers + self.prefetch_depth
+        if ahead < len(pairs):
+            self._prefetch(pairs[ahead][1], pairs[ahead][2])
         
-        return differences
+        return self.compare_file_pair(*pairs[index], mode)
+    
+    @staticmethod
+    def _samples_match(source_path: Path, target_path: Path, size: int) -> bool:
+        """
+        Compare the leading and trailing bytes of two files of equal size.
+        
+        Args:
+            source_path: Path to source file
+            target_path: Path to target file
+            size: Size of both files
+            
+        Returns:
+            True if both samples are identical
+        """
+        with open(source_path, 'rb') as src, open(target_path, 'rb') as tgt:
+            src_fd, tgt_fd = src.fileno(), tgt.fileno()
+            if os.pread(src_fd, SAMPLE_COMPARE_SIZE, 0) != os.pread(tgt_fd, SAMPLE_COMPARE_SIZE, 0):
+                return False
+            if size > SAMPLE_COMPARE_SIZE:
+                tail = max(SAMPLE_COMPARE_SIZE, size - SAMPLE_COMPARE_SIZE)
+                if os.pread(src_fd, SAMPLE_COMPARE_SIZE, tail) != os.pread(tgt_fd, SAMPLE_COMPARE_SIZE, tail):
+                    return False
+        return True
     
     def compare_file_pair(
         self,
         relative_path: str,
-        source_path: Path,
-        target_path: Path,
+        source_path: Union[str, Path],
+        target_path: Union[str, Path],
         mode: ComparisonMode
     ) -> Tuple[List[FileDifference], int]:
         """
@@ -363,14 +914,45 @@ class ComparisonEngine:
         
         try:
             include_checksum = mode in [ComparisonMode.FULL, ComparisonMode.CHECKSUM_ONLY]
+            comparator = _compile_comparator(mode, size_gate=True)
+            source_path = Path(source_path)
+            target_path = Path(target_path)
             
-            source_metadata = self.get_file_metadata(source_path, include_checksum)
-            target_metadata = self.get_file_metadata(target_path, include_checksum)
-            
-            bytes_processed = source_metadata.size
+            if mode == ComparisonMode.FULL and self.sample_compare:
+                source_metadata = self.get_file_metadata(source_path, include_checksum=False)
+                target_metadata = self.get_file_metadata(target_path, include_checksum=False)
+                bytes_processed = source_metadata.size
+                
+                hashable = [
+                    metadata for metadata in (source_metadata, target_metadata)
+                    if metadata.is_file and not metadata.is_symlink
+                ]
+                sampled = len(hashable) == 2 and source_metadata.size == target_metadata.size
+                if sampled and self._samples_match(source_path, target_path, source_metadata.size):
+                    # Head and tail together cover small files, so they are identical
+                    if source_metadata.size <= 2 * SAMPLE_COMPARE_SIZE:
+                        hashable = []
+                elif sampled:
+                    # Cheap head/tail check already proves the contents differ
+                    differences = comparator(source_metadata, target_metadata)
+                    differences.insert(0, FileDifference(
+                        path=source_metadata.path,
+                        difference_type=DifferenceType.CONTENT_MISMATCH,
+                        source_metadata=source_metadata,
+                        target_metadata=target_metadata,
+                        details="Content mismatch: leading/trailing sample differs"
+                    ))
+                    return differences, bytes_processed
+                
+                for metadata in hashable:
+                    metadata.checksum = self.calculate_checksum(metadata.path)
+                    metadata.checksum_algo = self.hash_algo
+            else:
+                source_metadata = self.get_file_metadata(source_path, include_checksum)
+                target_metadata = self.get_file_metadata(target_path, include_checksum)
+                bytes_processed = source_metadata.size
             
-            if mode != ComparisonMode.QUICK or source_metadata.size != target_metadata.size:
-                differences = self.compare_metadata(source_metadata, target_metadata, mode)
+            differences = comparator(source_metadata, target_metadata)
             
         except Exception as e:
             self.logger.error(f"Error comparing {relative_path}: {e}")
@@ -409,7 +991,8 @@ class ComparisonEngine:
             source_path=source_path,
             target_path=extracted_path,
             comparison_mode=mode,
-            excluded_patterns=self.exclude_patterns.copy()
+            excluded_patterns=self.exclude_patterns.copy(),
+            max_differences_in_memory=self.max_differences_in_memory
         )
         
         try:
@@ -419,39 +1002,43 @@ class ComparisonEngine:
             if not extracted_path.exists():
                 raise FileNotFoundError(f"Target path does not exist: {extracted_path}")
             
-            self.logger.info(f"Starting {mode.value} comparison: {source_path} vs {extracted_path}")
-            
-            # Collect all files from both directories
-            self.logger.info("Collecting source files...")
-            source_files = self.collect_files(source_path)
+            self.logger.info(f"Starting {_MODE_LABEL[mode]} comparison: {source_path} vs {extracted_path}")
             
-            self.logger.info("Collecting target files...")
-            target_files = self.collect_files(extracted_path)
+            # Walk both directories concurrently into one merged mapping
+            self.logger.info("Collecting source and target files...")
+            file_pairs = self.collect_file_pairs(source_path, extracted_path)
             
-            # Find all unique paths
-            all_paths = set(source_files.keys()) | set(target_files.keys())
+            missing_in_target = []
+            missing_in_source = []
+            common_paths = []
+            for relative_path, (source_file, target_file) in file_pairs.items():
+                if target_file is None:
+                    missing_in_target.append(relative_path)
+                elif source_file is None:
+                    missing_in_source.append(relative_path)
+                else:
+                    common_paths.append(relative_path)
             
-            # Identify missing files
-            missing_in_target = set(source_files.keys()) - set(target_files.keys())
-            missing_in_source = set(target_files.keys()) - set(source_files.keys())
-            common_paths = set(source_files.keys()) & set(target_files.keys())
-            
-            # Add missing file differences
-            for path in missing_in_target:
-                result.differences.append(FileDifference(
+            # Add missing file differences in bulk
+            result.add_differences([
+                FileDifference(
                     path=Path(path),
                     difference_type=DifferenceType.MISSING_TARGET,
-                    details=f"File exists in source but not in target"
-                ))
-                result.files_missing_target += 1
+                    details="File exists in source but not in target"
+                )
+                for path in missing_in_target
+            ])
+            result.files_missing_target = len(missing_in_target)
             
-            for path in missing_in_source:
-                result.differences.append(FileDifference(
+            result.add_differences([
+                FileDifference(
                     path=Path(path),
                     difference_type=DifferenceType.MISSING_SOURCE,
-                    details=f"File exists in target but not in source"
-                ))
-                result.files_missing_source += 1
+                    details="File exists in target but not in source"
+                )
+                for path in missing_in_source
+            ])
+            result.files_missing_source = len(missing_in_source)
             
             # Compare common files in parallel
             if common_paths:
@@ -459,26 +1046,31 @@ class ComparisonEngine:
                 
                 with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                     # Submit comparison tasks
+                    pairs = [
+                        (relative_path, *file_pairs[relative_path])
+                        for relative_path in common_paths
+                    ]
+                    
+                    # Content modes read every byte, so prime the page cache ahead
+                    # of the workers; the pool dequeues tasks in submission order
+                    if self.prefetch_depth and mode in (ComparisonMode.FULL, ComparisonMode.CHECKSUM_ONLY):
+                        task = self._compare_with_prefetch
+                        task_args = [(pairs, i, mode) for i in range(len(pairs))]
+                    else:
+                        task = self.compare_file_pair
+                        task_args = [(*pair, mode) for pair in pairs]
+                    
                     future_to_path = {}
-                    for relative_path in common_paths:
-                        source_file = source_files[relative_path]
-                        target_file = target_files[relative_path]
-                        
-                        future = executor.submit(
-                            self.compare_file_pair,
-                            relative_path,
-                            source_file,
-                            target_file,
-                            mode
-                        )
-                        future_to_path[future] = relative_path
+                    for args, pair in zip(task_args, pairs):
+                        future = executor.submit(task, *args)
+                        future_to_path[future] = pair[0]
                     
                     # Collect results
                     for future in as_completed(future_to_path):
                         relative_path = future_to_path[future]
                         try:
                             differences, bytes_processed = future.result()
-                            result.differences.extend(differences)
+                            result.add_differences(differences)
                             result.total_bytes_processed += bytes_processed
                             
                             if differences:
@@ -492,15 +1084,17 @@ class ComparisonEngine:
                             self.logger.error(error_msg)
             
             # Update final statistics
-            result.total_files_processed = len(all_paths)
+            result.total_files_processed = len(file_pairs)
             result.total_directories_processed = len([
-                p for p in source_files.values() if p.is_dir()
-            ]) + len([
-                p for p in target_files.values() if p.is_dir()
+                p for pair in file_pairs.values() for p in pair
+                if p is not None and os.path.isdir(p)
             ])
             
             result.processing_time = time.time() - start_time
             
+            if result._diff_sink is not None:
+                result._diff_sink.close()
+            
             self.logger.info(f"Comparison completed in {result.processing_time:.2f}s")
             self.logger.info(f"Success rate: {result.success_rate:.2f}%")
             
@@ -531,35 +1125,28 @@ class ComparisonEngine:
             ""
         ]
         
-        if result.differences:
+        if result.has_differences:
             report_lines.extend([
                 "DIFFERENCES FOUND:",
                 "-" * 40,
                 ""
             ])
             
-            # Group differences by type
-            by_type = {}
-            for diff in result.differences:
-                diff_type = diff.difference_type
-                if diff_type not in by_type:
-                    by_type[diff_type] = []
-                by_type[diff_type].append(diff)
-            
-            for diff_type, diffs in by_type.items():
+            # Totals and previews are tracked per type as differences are recorded
+            for diff_type, count in result.difference_counts.items():
                 report_lines.extend([
-                    f"{diff_type.value.upper().replace('_', ' ')} ({len(diffs)} files):",
+                    f"{_DIFF_LABELS[diff_type]} ({count} files):",
                     ""
                 ])
                 
-                for diff in diffs[:10]:  # Limit to first 10 per type
+                for diff in result.difference_previews[diff_type]:
                     report_lines.append(f"  • {diff.path}")
                     if diff.details:
                         report_lines.append(f"    {diff.details}")
                     report_lines.append("")
                 
-                if len(diffs) > 10:
-                    report_lines.append(f"  ... and {len(diffs) - 10} more files")
+                if count > REPORT_PREVIEW_LIMIT:
+                    report_lines.append(f"  ... and {count - REPORT_PREVIEW_LIMIT} more files")
                     report_lines.append("")
         
         if result.errors:
@@ -9,21 +9,34 @@ Author: DGMSTT System
 Version: 1.0.0
 """
 
+import asyncio
+import errno
 import hashlib
+import io
 import logging
+import mmap
 import os
+import queue
 import shutil
 import signal
 import stat
+import subprocess
 import tarfile
 import tempfile
 import zipfile
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 import threading
 import time
-from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache, partial
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
 
 # Configure logging
 logging.basicConfig(
@@ -33,8 +46,17 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Constants
-CHUNK_SIZE = 8192  # 8KB chunks for streaming
+CHUNK_SIZE = 1 << 22  # 4MB chunks for streaming
+COPY_BUFFER_SIZE = 1 << 20  # 1MB buffer for per-member copies
+INTERRUPT_CHECK_BYTES = 64 * 1024 * 1024  # Poll for interruption every 64MB read
 MAX_EXTRACT_SIZE = 10 * 1024 * 1024 * 1024  # 10GB limit
+MAX_COMPRESSION_RATIO = 1000  # Higher expansion ratios are treated as decompression bombs...
+RATIO_CHECK_MIN_SIZE = 1 << 30  # ...once the archive expands past 1GB; zero-filled files reach ~1000:1
+METADATA_FLUSH_MEMBERS = 1024  # Write extraction counters back every 1024 members
+PROGRESS_EVERY_MEMBERS = 256  # Report progress at least every 256 members...
+PROGRESS_INTERVAL = 0.1  # ...or every 100ms, whichever comes first
+PIPELINE_DEPTH = 4  # Decompressed chunks buffered between reader and writer in async_extract
+MMAP_FALLBACK_LIMIT = 1 << 30  # Largest file to mmap when free RAM is unknown
 SUPPORTED_FORMATS = {
     '.tar': 'tar',
     '.tar.gz': 'tar.gz',
@@ -42,10 +64,21 @@ SUPPORTED_FORMATS = {
     '.tar.bz2': 'tar.bz2',
     '.tbz2': 'tar.bz2',
     '.tar.xz': 'tar.xz',
+    '.tar.zst': 'tar.zst',
+    '.tzst': 'tar.zst',
     '.zip': 'zip',
     '.snapshot': 'qdrant'
 }
 
+_HAS_FADVISE = hasattr(os, 'posix_fadvise')
+_HAS_FALLOCATE = hasattr(os, 'posix_fallocate')
+
+# Flags for creating member files; never write through a symlink at the target
+_CREATE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_NOFOLLOW', 0)
+
+# Detected formats extracted by _extract_tar
+TAR_FORMATS = frozenset({'tar', 'tar.gz', 'tar.bz2', 'tar.xz', 'tar.zst'})
+
 # Magic bytes for format detection
 MAGIC_BYTES = {
     b'\x1f\x8b': 'gzip',
@@ -53,8 +86,171 @@ MAGIC_BYTES = {
     b'PK\x05\x06': 'zip',
     b'PK\x07\x08': 'zip',
     b'BZh': 'bzip2',
-    b'\xfd7zXZ\x00': 'xz'
+    b'\xfd7zXZ\x00': 'xz',
+    b'\x28\xb5\x2f\xfd': 'zstd'
+}
+
+# Extension table lowercased once, and magic bytes grouped by prefix length so
+# detection is one dict lookup per distinct length
+_EXT_TABLE = tuple((ext.lower(), format_type) for ext, format_type in SUPPORTED_FORMATS.items())
+_MAGIC_LENGTHS = tuple(sorted({len(magic) for magic in MAGIC_BYTES}))
+HEADER_SIZE = 16  # Bytes read for magic-bytes detection
+
+# Archive format for each compressed magic-bytes format
+MAGIC_ARCHIVE_FORMATS = {
+    'gzip': 'tar.gz',
+    'bzip2': 'tar.bz2',
+    'xz': 'tar.xz',
+    'zstd': 'tar.zst'
+}
+
+# Tar compression suffix for each compressed magic-bytes format
+TAR_COMPRESSION = {
+    'gzip': 'gz',
+    'bzip2': 'bz2',
+    'xz': 'xz',
+    'zstd': 'zst'
+}
+
+# External decompressors per tar compression, tried in order. Each reads the
+# archive on stdin and writes the tar stream to stdout using several cores.
+PARALLEL_DECOMPRESSORS = {
+    'gz': (('igzip', ('-dc',)), ('pigz', ('-dc',))),
+    'bz2': (('lbzip2', ('-dc',)), ('pbzip2', ('-dc',))),
+    'xz': (('pixz', ('-d',)), ('xz', ('-T0', '-dc'))),
+    'zst': (('zstd', ('-dc',)),)
 }
+PIPE_BUFFER_SIZE = 4 << 20  # 4MB buffer on decompressor pipes
+
+
+@contextmanager
+def _read_once(fd: int):
+    """
+    Advise sequential readahead on an archive and drop its cached pages after.
+    
+    Archives are read exactly once, so keeping them in the page cache would
+    only evict other workloads' pages.
+    
+    Args:
+        fd: Descriptor of the file being read.
+    """
+    if _HAS_FADVISE:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    try:
+        yield
+    finally:
+        if _HAS_FADVISE:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """
+    Reserve the final size of an output file before writing it.
+    
+    Archive headers give exact member sizes, so one allocation yields
+    contiguous extents and surfaces a full disk before any data is written.
+    Filesystems without fallocate support fall back to ftruncate.
+    
+    Args:
+        fd: Descriptor of the freshly created output file.
+        size: Final size of the file in bytes.
+        
+    Raises:
+        OSError: If the filesystem has no room for the file.
+    """
+    if size <= 0:
+        return
+    if _HAS_FALLOCATE:
+        try:
+            os.posix_fallocate(fd, 0, size)
+            return
+        except OSError as e:
+            if e.errno in (errno.ENOSPC, errno.EFBIG):
+                raise
+    os.ftruncate(fd, size)
+
+
+def _magic_format(header: bytes) -> Optional[str]:
+    """
+    Look up a file header in MAGIC_BYTES.
+    
+    Args:
+        header: Leading bytes of the file.
+        
+    Returns:
+        Magic-bytes format name, or None if no magic matches.
+    """
+    for length in _MAGIC_LENGTHS:
+        format_type = MAGIC_BYTES.get(header[:length])
+        if format_type is not None:
+            return format_type
+    return None
+
+
+def _extension_format(name: str) -> Optional[str]:
+    """
+    Look up a file name's extension in SUPPORTED_FORMATS.
+    
+    Args:
+        name: File name.
+        
+    Returns:
+        Archive format, or None if no supported extension matches.
+    """
+    name = name.lower()
+    for ext, format_type in _EXT_TABLE:
+        if name.endswith(ext):
+            return format_type
+    return None
+
+
+def _mmap_limit() -> int:
+    """
+    Return the largest file size worth hashing through mmap.
+    
+    Returns:
+        Half of the currently free physical memory, or MMAP_FALLBACK_LIMIT if
+        the platform cannot report it.
+    """
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE') // 2
+    except (AttributeError, OSError, ValueError):
+        return MMAP_FALLBACK_LIMIT
+
+
+@lru_cache(maxsize=None)
+def _accelerated_gzip():
+    """
+    Import the fastest available gzip implementation.
+    
+    Returns:
+        isal.igzip or zlib_ng.gzip_ng module, or None if neither is installed.
+    """
+    try:
+        from isal import igzip
+        return igzip
+    except ImportError:
+        pass
+    try:
+        from zlib_ng import gzip_ng
+        return gzip_ng
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _zstandard():
+    """
+    Import the zstandard module.
+    
+    Returns:
+        zstandard module, or None if it is not installed.
+    """
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        return None
 
 
 @dataclass
@@ -112,6 +308,224 @@ class ExtractionResult:
         }
 
 
+class _InterruptibleReader(io.RawIOBase):
+    """
+    Raw reader wrapper that polls an interruption check while being read.
+    
+    Lets C-driven read loops such as hashlib.file_digest stay responsive to
+    signals without a Python-level check per chunk.
+    """
+    
+    def __init__(self, raw: io.RawIOBase, check: Callable[[], None]):
+        """
+        Initialize the reader.
+        
+        Args:
+            raw: Unbuffered binary file to read from.
+            check: Callable raising if the operation was interrupted.
+        """
+        self._raw = raw
+        self._check = check
+        self._bytes_since_check = 0
+    
+    def readable(self) -> bool:
+        """Report the stream as readable."""
+        return True
+    
+    def readinto(self, buffer) -> int:
+        """Read into buffer, polling the check every INTERRUPT_CHECK_BYTES."""
+        n = self._raw.readinto(buffer)
+        if n:
+            self._bytes_since_check += n
+            if self._bytes_since_check >= INTERRUPT_CHECK_BYTES:
+                self._bytes_since_check = 0
+                self._check()
+        return n
+
+
+class HashingReader(io.RawIOBase):
+    """
+    Raw reader that computes a file checksum while it is being read.
+    
+    Lets extraction and checksumming share a single pass over the archive.
+    Only bytes past the furthest position hashed so far are fed to the hash,
+    so archive readers that seek backwards do not double count; seeking
+    forward past that position reads and hashes the skipped bytes first so
+    the digest always covers the file in order.
+    """
+    
+    def __init__(
+        self,
+        raw: io.RawIOBase,
+        check: Optional[Callable[[], None]] = None,
+        hasher: Optional[Any] = None
+    ):
+        """
+        Initialize the reader.
+        
+        Args:
+            raw: Unbuffered binary file positioned at its start.
+            check: Optional callable raising if the operation was interrupted.
+            hasher: Hash object to feed. Uses SHA-256 if None.
+        """
+        self._raw = raw
+        self._check = check
+        self._hash = hasher if hasher is not None else hashlib.sha256()
+        self._pos = 0
+        self._hashed = 0
+        self._bytes_since_check = 0
+    
+    def readable(self) -> bool:
+        """Report the stream as readable."""
+        return True
+    
+    def seekable(self) -> bool:
+        """Report whether the underlying file is seekable."""
+        return self._raw.seekable()
+    
+    def tell(self) -> int:
+        """Return the current read position."""
+        return self._pos
+    
+    def _account(self, n: int) -> None:
+        """Poll the interruption check every INTERRUPT_CHECK_BYTES hashed."""
+        self._bytes_since_check += n
+        if self._check and self._bytes_since_check >= INTERRUPT_CHECK_BYTES:
+            self._bytes_since_check = 0
+            self._check()
+    
+    def readinto(self, buffer) -> int:
+        """Read into buffer, hashing any bytes not hashed before."""
+        n = self._raw.readinto(buffer)
+        if n:
+            end = self._pos + n
+            if end > self._hashed:
+                with memoryview(buffer) as view:
+                    self._hash.update(view[self._hashed - self._pos:n])
+                self._account(end - self._hashed)
+                self._hashed = end
+            self._pos = end
+        return n
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Seek, reading through any unhashed bytes that would be skipped."""
+        if whence == io.SEEK_CUR:
+            offset, whence = self._pos + offset, io.SEEK_SET
+        target = self._raw.seek(offset, whence)
+        
+        if target > self._hashed:
+            self._raw.seek(self._hashed)
+            buf = bytearray(min(CHUNK_SIZE, target - self._hashed))
+            view = memoryview(buf)
+            while self._hashed < target:
+                n = self._raw.readinto(view[:min(len(buf), target - self._hashed)])
+                if not n:
+                    break
+                self._hash.update(view[:n])
+                self._hashed += n
+                self._account(n)
+            self._raw.seek(target)
+        
+        self._pos = target
+        return target
+    
+    def hexdigest(self) -> str:
+        """Hash whatever has not been read yet and return the file digest."""
+        self.seek(0, io.SEEK_END)
+        return self._hash.hexdigest()
+
+
+class _ExtractionTally:
+    """
+    Batches per-member metadata and progress updates during extraction.
+    
+    Counters are kept locally and written back to the metadata every
+    METADATA_FLUSH_MEMBERS members and on flush(). The progress callback fires
+    once every report_every members or PROGRESS_INTERVAL seconds, and its
+    message is only formatted when it does.
+    """
+    
+    def __init__(
+        self,
+        metadata: 'ExtractionMetadata',
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        report_every: int = PROGRESS_EVERY_MEMBERS
+    ):
+        """
+        Initialize the tally from the metadata's current counters.
+        
+        Args:
+            metadata: Metadata object to update.
+            progress_callback: Optional progress callback function.
+            report_every: Members between progress reports.
+        """
+        self.metadata = metadata
+        self._callback = progress_callback
+        self._report_every = report_every
+        self._total_files = metadata.total_files
+        self._total_size = metadata.total_size
+        self._files = metadata.extracted_files
+        self._size = metadata.extracted_size
+        self._unflushed = 0
+        self._since_progress = 0
+        self._last_progress = time.monotonic()
+    
+    def seen(self, size: int, count: int = 1) -> None:
+        """
+        Count members towards the archive totals, for streamed archives.
+        
+        Args:
+            size: Member data size, 0 for non-files.
+            count: Number of members the size covers.
+        """
+        self._total_files += count
+        self._total_size += size
+    
+    def extracted(self, size: int, name: str, done: float, total: float) -> None:
+        """
+        Record an extracted member and report progress if it is due.
+        
+        Args:
+            size: Member data size, 0 for non-files.
+            name: Member name, used in the progress message.
+            done: Work completed so far, in the same unit as total.
+            total: Total work.
+        """
+        self._files += 1
+        self._size += size
+        self._unflushed += 1
+        if self._unflushed >= METADATA_FLUSH_MEMBERS:
+            self.flush()
+        
+        if self._callback is not None:
+            self._since_progress += 1
+            now = time.monotonic()
+            if self._since_progress >= self._report_every or now - self._last_progress >= PROGRESS_INTERVAL:
+                self._since_progress = 0
+                self._last_progress = now
+                self._callback(min(done / total * 100, 100.0), f"Extracted: {name}")
+    
+    def failed(self, name: str, error: Exception) -> None:
+        """
+        Record a member that failed to extract.
+        
+        Args:
+            name: Member name.
+            error: Exception raised while extracting it.
+        """
+        self.metadata.errors.append(f"Failed to extract {name}: {error}")
+        logger.error("Failed to extract %s: %s", name, error)
+    
+    def flush(self) -> None:
+        """Write the local counters back to the metadata."""
+        metadata = self.metadata
+        metadata.total_files = self._total_files
+        metadata.total_size = self._total_size
+        metadata.extracted_files = self._files
+        metadata.extracted_size = self._size
+        self._unflushed = 0
+
+
 class ExtractionError(Exception):
     """Custom exception for extraction-related errors."""
     pass
@@ -130,21 +544,60 @@ class ExtractionEngine:
     memory-efficient processing, and detailed progress reporting.
     """
     
-    def __init__(self, temp_base_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        temp_base_dir: Optional[Path] = None,
+        extract_concurrency: int = 1,
+        reuse_temp_dir: bool = False,
+        checksum_algorithm: str = 'sha256',
+        max_compression_ratio: float = MAX_COMPRESSION_RATIO
+    ):
         """
         Initialize extraction engine.
         
         Args:
             temp_base_dir: Base directory for temporary files. Uses system temp if None.
+            extract_concurrency: Number of threads writing archive members. Values
+                above 1 extract zip archives and uncompressed tar archives in
+                parallel, which mostly helps many-small-file archives on network
+                filesystems. Compressed tar streams are always extracted serially.
+            reuse_temp_dir: Extract every test_extraction call without an explicit
+                extraction_dir into one temp directory, emptied between runs.
+                Saves directory setup and teardown in batch runs, but each run
+                invalidates the previous result's extraction_path.
+            checksum_algorithm: Archive checksum algorithm, 'sha256' or 'blake3'.
+                blake3 hashes on all cores and falls back to sha256 if the
+                blake3 package is not installed.
+            max_compression_ratio: Largest uncompressed:compressed ratio accepted
+                once an archive expands past RATIO_CHECK_MIN_SIZE. Smaller
+                archives are never rejected for their ratio, since zero-filled
+                or preallocated files legitimately compress about 1000:1.
+            
+        Raises:
+            ValueError: If checksum_algorithm is not supported.
         """
+        if checksum_algorithm not in ('sha256', 'blake3'):
+            raise ValueError(f"Unsupported checksum algorithm: {checksum_algorithm}")
+        if checksum_algorithm == 'blake3' and blake3 is None:
+            logger.info("blake3 is not installed, falling back to sha256")
+            checksum_algorithm = 'sha256'
+        
         self.temp_base_dir = temp_base_dir
+        self.extract_concurrency = max(1, extract_concurrency)
+        self.reuse_temp_dir = reuse_temp_dir
+        self.checksum_algorithm = checksum_algorithm
+        self.max_compression_ratio = max_compression_ratio
         self.temp_dirs: List[Path] = []
         self._interrupted = False
         self._lock = threading.Lock()
+        self._processes: List[subprocess.Popen] = []
+        self._pool: Optional[ThreadPoolExecutor] = None
         
-        # Register signal handlers for cleanup
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        # Register signal handlers for cleanup. Python only allows this on the
+        # main thread, so engines created in worker threads rely on their owner.
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, self._signal_handler)
+            signal.signal(signal.SIGTERM, self._signal_handler)
     
     def __enter__(self):
         """Context manager entry."""
@@ -164,13 +617,38 @@ class ExtractionEngine:
         if self._interrupted:
             raise ExtractionError("Extraction interrupted by user")
     
+    def _new_hasher(self):
+        """
+        Create a hash object for the configured checksum algorithm.
+        
+        Returns:
+            blake3 hasher using all cores, or a SHA-256 hasher.
+        """
+        if self.checksum_algorithm == 'blake3':
+            return blake3.blake3(max_threads=blake3.blake3.AUTO)
+        return hashlib.sha256()
+    
     def _create_secure_temp_dir(self) -> Path:
         """
         Create secure temporary directory with proper permissions.
         
+        With reuse_temp_dir, the first directory created is emptied and
+        returned again on later calls.
+        
         Returns:
             Path to created temporary directory.
         """
+        if self.reuse_temp_dir and self.temp_dirs and self.temp_dirs[0].is_dir():
+            temp_dir = self.temp_dirs[0]
+            with os.scandir(temp_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+            logger.debug("Reusing temp directory: %s", temp_dir)
+            return temp_dir
+        
         temp_dir = Path(tempfile.mkdtemp(
             prefix='extraction_',
             dir=self.temp_base_dir
@@ -182,7 +660,7 @@ class ExtractionEngine:
         with self._lock:
             self.temp_dirs.append(temp_dir)
         
-        logger.debug(f"Created secure temp directory: {temp_dir}")
+        logger.debug("Created secure temp directory: %s", temp_dir)
         return temp_dir
     
     def _detect_format(self, backup_path: Path) -> str:
@@ -199,64 +677,198 @@ class ExtractionEngine:
             ExtractionError: If format cannot be detected.
         """
         # Check file extension
-        for ext, format_type in SUPPORTED_FORMATS.items():
-            if backup_path.name.lower().endswith(ext.lower()):
-                logger.debug(f"Format detected by extension: {format_type}")
-                return format_type
+        format_type = _extension_format(backup_path.name)
+        if format_type is not None:
+            logger.debug("Format detected by extension: %s", format_type)
+            return format_type
         
         # Check magic bytes
         try:
             with open(backup_path, 'rb') as f:
-                header = f.read(8)
-                
-            for magic, format_type in MAGIC_BYTES.items():
-                if header.startswith(magic):
-                    logger.debug(f"Format detected by magic bytes: {format_type}")
-                    if format_type == 'gzip':
-                        return 'tar.gz'
-                    elif format_type == 'bzip2':
-                        return 'tar.bz2'
-                    elif format_type == 'xz':
-                        return 'tar.xz'
-                    return format_type
+                header = f.read(HEADER_SIZE)
+            
+            format_type = _magic_format(header)
+            if format_type is not None:
+                logger.debug("Format detected by magic bytes: %s", format_type)
+                return MAGIC_ARCHIVE_FORMATS.get(format_type, format_type)
                     
         except Exception as e:
             logger.warning(f"Could not read magic bytes: {e}")
         
         raise ExtractionError(f"Unsupported or unrecognized format: {backup_path}")
     
-    def _validate_path_security(self, member_path: str, extraction_dir: Path) -> bool:
+    def detect_format_many(self, paths: Iterable[Path]) -> Dict[Path, str]:
+        """
+        Detect the formats of many backups, e.g. when sweeping a backup directory.
+        
+        Files without a supported extension have only their first HEADER_SIZE
+        bytes read, with a single pread each.
+        
+        Args:
+            paths: Backup file paths.
+            
+        Returns:
+            Mapping of each path to its detected format, 'unknown' if unrecognized.
+        """
+        formats: Dict[Path, str] = {}
+        for path in paths:
+            format_type = _extension_format(path.name)
+            if format_type is None:
+                try:
+                    fd = os.open(path, os.O_RDONLY)
+                    try:
+                        header = os.pread(fd, HEADER_SIZE, 0)
+                    finally:
+                        os.close(fd)
+                    format_type = _magic_format(header)
+                    format_type = MAGIC_ARCHIVE_FORMATS.get(format_type, format_type)
+                except OSError as e:
+                    logger.warning(f"Could not read magic bytes from {path}: {e}")
+            formats[path] = format_type or 'unknown'
+        return formats
+    
+    def _validate_path_security(
+        self,
+        member_path: str,
+        resolved_root: str,
+        link_paths: Optional[Set[str]] = None
+    ) -> bool:
         """
         Validate extraction path for security (prevent path traversal).
         
+        The check is purely lexical, so it costs no syscalls per member. The
+        exception is a member at or below a symlink extracted earlier from the
+        same archive. That path is resolved on disk, since the link may point
+        outside the extraction directory.
+        
         Args:
             member_path: Path of archive member.
-            extraction_dir: Target extraction directory.
+            resolved_root: Resolved extraction directory with a trailing os.sep.
+            link_paths: Normalized ('/'-joined, no '.' parts) paths of symlinks
+                extracted so far.
             
         Returns:
             True if path is safe, False otherwise.
         """
-        # Normalize paths
-        member_path = os.path.normpath(member_path)
-        extraction_dir = extraction_dir.resolve()
+        # Split into components, dropping empty and '.' parts
+        if member_path.startswith(('/', os.sep)) or os.path.isabs(member_path):
+            logger.warning("Potential path traversal detected: %s", member_path)
+            return False
+        parts = []
+        for part in member_path.split('/'):
+            if part == '..':
+                logger.warning("Potential path traversal detected: %s", member_path)
+                return False
+            if part and part != '.':
+                parts.append(part)
+        
+        # Without '..' or a leading '/', the joined path cannot leave the root
+        # lexically; only a symlink extracted earlier can redirect it
+        if link_paths:
+            prefix = ''
+            for part in parts:
+                prefix = f"{prefix}/{part}" if prefix else part
+                if prefix in link_paths:
+                    full_path = os.path.realpath(os.path.join(resolved_root, *parts))
+                    if not os.path.join(full_path, '').startswith(resolved_root):
+                        logger.warning("Path outside extraction directory: %s", full_path)
+                        return False
+                    break
+        return True
+    
+    def _screen_member(
+        self,
+        name: str,
+        size: int,
+        resolved_root: str,
+        metadata: ExtractionMetadata,
+        link_paths: Optional[Set[str]] = None,
+        is_symlink: bool = False
+    ) -> bool:
+        """
+        Apply the security and size checks to an archive member.
+        
+        Skipped members are recorded as metadata warnings.
         
-        # Check for path traversal attempts
-        if '..' in member_path or member_path.startswith('/'):
-            logger.warning(f"Potential path traversal detected: {member_path}")
+        Args:
+            name: Member path inside the archive.
+            size: Member data size.
+            resolved_root: Resolved extraction directory with a trailing os.sep.
+            metadata: Metadata object to update.
+            link_paths: Symlinks extracted so far; accepted symlinks are added.
+            is_symlink: Whether the member is a symlink.
+            
+        Returns:
+            True if the member may be extracted.
+        """
+        # Security validation
+        if not self._validate_path_security(name, resolved_root, link_paths):
+            metadata.warnings.append(f"Skipped unsafe path: {name}")
             return False
+        if is_symlink and link_paths is not None:
+            link_paths.add(os.path.normpath(name))
         
-        # Ensure extracted path stays within extraction directory
-        full_path = (extraction_dir / member_path).resolve()
-        try:
-            full_path.relative_to(extraction_dir)
-            return True
-        except ValueError:
-            logger.warning(f"Path outside extraction directory: {full_path}")
+        # Size check
+        if size > MAX_EXTRACT_SIZE:
+            metadata.warnings.append(f"Skipped oversized file: {name}")
             return False
+        return True
+    
+    def _check_extraction_budget(self, uncompressed_size: int, compressed_size: int) -> None:
+        """
+        Reject archives that expand beyond the size budget or ratio limit.
+        
+        The ratio limit only applies past RATIO_CHECK_MIN_SIZE, so small
+        archives of highly compressible data still extract.
+        
+        Args:
+            uncompressed_size: Bytes the archive extracts to (so far).
+            compressed_size: Bytes of archive data producing them.
+            
+        Raises:
+            SecurityError: If MAX_EXTRACT_SIZE or max_compression_ratio is exceeded.
+        """
+        if uncompressed_size > MAX_EXTRACT_SIZE:
+            raise SecurityError(
+                f"Archive expands to more than {MAX_EXTRACT_SIZE} bytes, aborting before extraction"
+            )
+        if (
+            uncompressed_size > RATIO_CHECK_MIN_SIZE
+            and compressed_size * self.max_compression_ratio < uncompressed_size
+        ):
+            raise SecurityError(
+                f"Archive expands {uncompressed_size} bytes from {compressed_size}, over "
+                f"{self.max_compression_ratio}:1; likely a decompression bomb"
+            )
+    
+    def _preflight_zip(self, members: List[zipfile.ZipInfo]) -> None:
+        """
+        Check a zip's central directory against the extraction budget.
+        
+        Members over MAX_EXTRACT_SIZE are left out, since they are skipped
+        individually during extraction.
+        
+        Args:
+            members: Entries from ZipFile.infolist().
+            
+        Raises:
+            SecurityError: If the archive would exceed the budget.
+        """
+        uncompressed_size = compressed_size = 0
+        for member in members:
+            if member.file_size <= MAX_EXTRACT_SIZE:
+                uncompressed_size += member.file_size
+                compressed_size += member.compress_size
+        self._check_extraction_budget(uncompressed_size, compressed_size)
     
     def _calculate_checksum(self, file_path: Path) -> str:
         """
-        Calculate SHA256 checksum of file.
+        Calculate the checksum of a file with the configured algorithm.
+        
+        blake3 hashes through its own multi-threaded mmap path. For SHA-256,
+        files smaller than half the free memory are memory-mapped and hashed
+        in INTERRUPT_CHECK_BYTES slices, leaving readahead to the kernel.
+        Larger files are read in chunks.
         
         Args:
             file_path: Path to file.
@@ -264,81 +876,534 @@ class ExtractionEngine:
         Returns:
             Hexadecimal checksum string.
         """
-        sha256_hash = hashlib.sha256()
+        if self.checksum_algorithm == 'blake3':
+            blake3_hash = self._new_hasher()
+            blake3_hash.update_mmap(file_path)
+            return blake3_hash.hexdigest()
         
-        with open(file_path, 'rb') as f:
-            while chunk := f.read(CHUNK_SIZE):
-                sha256_hash.update(chunk)
-                self._check_interrupted()
+        with open(file_path, 'rb', buffering=0) as f, _read_once(f.fileno()):
+            size = os.fstat(f.fileno()).st_size
+            if 0 < size < _mmap_limit():
+                sha256_hash = hashlib.sha256()
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    with memoryview(mm) as view:
+                        for start in range(0, size, INTERRUPT_CHECK_BYTES):
+                            sha256_hash.update(view[start:start + INTERRUPT_CHECK_BYTES])
+                            self._check_interrupted()
+                return sha256_hash.hexdigest()
+            
+            reader = _InterruptibleReader(f, self._check_interrupted)
+            
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(reader, 'sha256').hexdigest()
+            
+            sha256_hash = hashlib.sha256()
+            buf = bytearray(CHUNK_SIZE)
+            view = memoryview(buf)
+            while n := reader.readinto(buf):
+                sha256_hash.update(view[:n])
         
         return sha256_hash.hexdigest()
     
+    @staticmethod
+    @contextmanager
+    def _open_archive_stream(backup_path: Path, fileobj: Optional[io.RawIOBase] = None):
+        """
+        Open a large-buffered reader over the archive.
+        
+        Args:
+            backup_path: Path to the archive, opened if fileobj is None.
+            fileobj: Already-open raw binary file (e.g. a HashingReader). It is
+                left open afterwards.
+            
+        Yields:
+            io.BufferedReader over the archive.
+        """
+        with ExitStack() as stack:
+            if fileobj is None:
+                fileobj = stack.enter_context(open(backup_path, 'rb', buffering=0))
+                stack.enter_context(_read_once(fileobj.fileno()))
+            buffered = io.BufferedReader(fileobj, buffer_size=CHUNK_SIZE)
+            try:
+                yield buffered
+            finally:
+                # Detach so closing the buffer never closes a caller-owned fileobj
+                buffered.detach()
+    
     def _extract_tar(
         self,
         backup_path: Path,
         extraction_dir: Path,
         metadata: ExtractionMetadata,
-        progress_callback: Optional[Callable[[float, str], None]] = None
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        fileobj: Optional[io.RawIOBase] = None
     ) -> None:
         """
         Extract tar archive with streaming and security checks.
         
+        The archive is read as a forward-only stream, so extraction starts with
+        the first member and compressed data is decompressed exactly once.
+        Progress is reported by archive bytes consumed.
+        
         Args:
             backup_path: Path to tar archive.
             extraction_dir: Target extraction directory.
             metadata: Metadata object to update.
             progress_callback: Optional progress callback function.
+            fileobj: Already-open raw binary file for the archive. Opened from
+                backup_path if None.
         """
-        # Determine compression mode
-        if backup_path.suffix.lower() in ['.gz', '.tgz']:
-            mode = 'r:gz'
-        elif backup_path.suffix.lower() in ['.bz2', '.tbz2']:
-            mode = 'r:bz2'
-        elif backup_path.suffix.lower() == '.xz':
-            mode = 'r:xz'
-        else:
-            mode = 'r'
+        compression = self._sniff_compression(backup_path)
+        uncompressed = not compression
+        parallel = self.extract_concurrency > 1 and uncompressed
         
-        with tarfile.open(backup_path, mode) as tar:
-            members = tar.getmembers()
-            metadata.total_files = len(members)
-            metadata.total_size = sum(m.size for m in members if m.isfile())
+        with ExitStack() as stack:
+            stream = stack.enter_context(self._open_archive_stream(backup_path, fileobj))
+            tar_source, mode = self._open_tar_source(stream, compression, stack)
+            tar = stack.enter_context(tarfile.open(
+                fileobj=tar_source,
+                mode=mode,
+                bufsize=COPY_BUFFER_SIZE,
+                copybufsize=COPY_BUFFER_SIZE
+            ))
+            archive_size = max(backup_path.stat().st_size, 1)
             
-            for i, member in enumerate(members):
+            if uncompressed:
+                # Member data is copied straight from the archive's own descriptor
+                src_fd = os.open(backup_path, os.O_RDONLY)
+                stack.callback(os.close, src_fd)
+                stack.enter_context(_read_once(src_fd))
+            
+            # Parallel work is kept as column lists, one entry per regular file
+            task_names: List[str] = []
+            task_sizes: List[int] = []
+            task_members: List[tarfile.TarInfo] = []
+            task_paths: List[str] = []
+            deferred: List[tarfile.TarInfo] = []
+            extraction_root = str(extraction_dir)
+            created_dirs: Set[str] = set()
+            resolved_root = os.path.join(str(extraction_dir.resolve()), '')
+            link_paths: Set[str] = set()
+            tally = _ExtractionTally(metadata, progress_callback)
+            stack.callback(tally.flush)
+            
+            def extract_member(member: tarfile.TarInfo, done: float, total: float) -> None:
+                try:
+                    if uncompressed and member.isreg() and not member.issparse():
+                        target_path = os.path.join(extraction_root, member.name)
+                        self._make_parent_dirs(target_path, created_dirs)
+                        self._sendfile_member(tar, member, src_fd, target_path)
+                    else:
+                        tar.extract(member, extraction_dir)
+                        # tarfile only logs links it cannot create, so check
+                        if not member.isreg() and not os.path.lexists(os.path.join(extraction_root, member.name)):
+                            logger.warning("Could not create %s", member.name)
+                            metadata.warnings.append(f"Could not create {member.name}")
+                            return
+                    tally.extracted(member.size if member.isfile() else 0, member.name, done, total)
+                except Exception as e:
+                    tally.failed(member.name, e)
+            
+            def run_tasks() -> int:
+                tally.flush()
+                done = self._run_concurrent_extractions(
+                    lambda member, target_path: self._sendfile_member(tar, member, src_fd, target_path),
+                    task_names,
+                    task_sizes,
+                    (task_members, task_paths),
+                    metadata.extracted_files,
+                    metadata.total_files,
+                    tally
+                )
+                for column in (task_names, task_sizes, task_members, task_paths):
+                    column.clear()
+                return done
+            
+            # Members are parsed as the stream advances; totals grow as we go
+            budget_used = 0
+            for member in tar:
                 self._check_interrupted()
+                tally.seen(member.size if member.isfile() else 0)
                 
-                # Security validation
-                if not self._validate_path_security(member.name, extraction_dir):
-                    metadata.warnings.append(f"Skipped unsafe path: {member.name}")
+                if not self._screen_member(member.name, member.size, resolved_root, metadata, link_paths, member.issym()):
                     continue
                 
-                # Size check
-                if member.size > MAX_EXTRACT_SIZE:
-                    metadata.warnings.append(f"Skipped oversized file: {member.name}")
-                    continue
+                # Enforce the archive-wide budget before starting the member
+                if member.isfile():
+                    budget_used += member.size
+                    self._check_extraction_budget(budget_used, archive_size)
                 
+                if not parallel or member.issparse() or not (member.isreg() or member.islnk() or member.isdir()):
+                    # Sparse data can only be read from the stream in place, and
+                    # symlinks must exist before later members are screened
+                    if parallel and member.issym() and task_names:
+                        # Queued files may share the link's path; finish them
+                        # first so no worker opens the path after the link exists
+                        run_tasks()
+                    extract_member(member, stream.tell(), archive_size)
+                elif member.isreg():
+                    target_path = os.path.join(extraction_root, member.name)
+                    self._make_parent_dirs(target_path, created_dirs)
+                    task_names.append(member.name)
+                    task_sizes.append(member.size)
+                    task_members.append(member)
+                    task_paths.append(target_path)
+                else:
+                    # Directories and hard links go after the regular files so
+                    # hard links have targets and directory mtimes stick
+                    deferred.append(member)
+            
+            if parallel:
+                n_members = metadata.total_files
+                done = run_tasks()
+                for member in deferred:
+                    self._check_interrupted()
+                    done += 1
+                    extract_member(member, done, n_members)
+    
+    @staticmethod
+    def _sniff_compression(backup_path: Path) -> str:
+        """
+        Identify a tar archive's compression from its magic bytes.
+        
+        Logs a warning for bzip2, which is slow enough to be worth re-encoding.
+        
+        Args:
+            backup_path: Path to archive.
+            
+        Returns:
+            Tar compression suffix ('gz', 'bz2', 'xz' or 'zst'), or '' if the
+            archive is not compressed.
+        """
+        with open(backup_path, 'rb') as f:
+            header = f.read(HEADER_SIZE)
+        compression = TAR_COMPRESSION.get(_magic_format(header), '')
+        
+        if compression == 'bz2':
+            logger.warning(
+                f"{backup_path.name} is bzip2-compressed, which decompresses at only a few MB/s; "
+                f"consider re-encoding backups as .tar.zst or .tar.xz"
+            )
+        return compression
+    
+    def _open_tar_source(self, stream: io.BufferedReader, compression: str, stack: ExitStack) -> Tuple[Any, str]:
+        """
+        Choose the decompressor and tarfile mode for an archive stream.
+        
+        Prefers an external parallel decompressor, then isal or zlib-ng for
+        gzip and zstandard for zstd, falling back to tarfile's built-in codecs.
+        The mode is always a forward-only stream mode.
+        
+        Args:
+            stream: Buffered archive stream.
+            compression: Compression suffix from _sniff_compression.
+            stack: Exit stack that closes any decompressor opened here.
+            
+        Returns:
+            Tuple of (file object for tarfile, tarfile mode).
+            
+        Raises:
+            ExtractionError: If a zstd archive is given without a zstd decoder.
+        """
+        if not compression:
+            return stream, 'r|'
+        
+        pipe = self._open_parallel_decompressor(stream, compression, stack)
+        if pipe is not None:
+            return pipe, 'r|'
+        
+        if compression == 'gz':
+            gzip_module = _accelerated_gzip()
+            if gzip_module is not None:
+                return stack.enter_context(gzip_module.open(stream, 'rb')), 'r|'
+        elif compression == 'zst':
+            zstandard = _zstandard()
+            if zstandard is None:
+                raise ExtractionError("zstandard or the zstd tool is required to extract .tar.zst archives")
+            reader = zstandard.ZstdDecompressor().stream_reader(stream, read_size=CHUNK_SIZE, closefd=False)
+            return stack.enter_context(reader), 'r|'
+        
+        return stream, f'r|{compression}'
+    
+    def _open_parallel_decompressor(
+        self,
+        stream: io.BufferedReader,
+        compression: str,
+        stack: ExitStack
+    ) -> Optional[io.BufferedReader]:
+        """
+        Decompress an archive stream through an external multi-threaded tool.
+        
+        A feeder thread copies the archive stream into the tool's stdin, so the
+        stream's checksum still covers every byte in a single pass. On exit the
+        stack drains and reaps the process, or kills it if extraction failed.
+        
+        Args:
+            stream: Buffered archive stream.
+            compression: Compression suffix from _sniff_compression.
+            stack: Exit stack that owns the process.
+            
+        Returns:
+            Pipe carrying the decompressed tar stream, or None if no tool is installed.
+        """
+        for tool, args in PARALLEL_DECOMPRESSORS.get(compression, ()):
+            executable = shutil.which(tool)
+            if executable:
+                break
+        else:
+            return None
+        
+        logger.debug("Decompressing with %s", executable)
+        proc = subprocess.Popen(
+            [executable, *args],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=PIPE_BUFFER_SIZE
+        )
+        with self._lock:
+            self._processes.append(proc)
+        
+        feed_errors: List[BaseException] = []
+        
+        def feed() -> None:
+            try:
+                shutil.copyfileobj(stream, proc.stdin, CHUNK_SIZE)
+            except BrokenPipeError:
+                pass
+            except BaseException as e:
+                feed_errors.append(e)
+            finally:
                 try:
-                    tar.extract(member, extraction_dir)
-                    metadata.extracted_files += 1
-                    if member.isfile():
-                        metadata.extracted_size += member.size
-                    
-                    # Progress callback
-                    if progress_callback:
-                        progress = (i + 1) / len(members) * 100
-                        progress_callback(progress, f"Extracted: {member.name}")
-                        
-                except Exception as e:
-                    error_msg = f"Failed to extract {member.name}: {e}"
-                    metadata.errors.append(error_msg)
-                    logger.error(error_msg)
+                    proc.stdin.close()
+                except OSError:
+                    pass
+        
+        feeder = threading.Thread(target=feed, name=f"{tool}-feeder", daemon=True)
+        feeder.start()
+        
+        def close(exc_type, exc, tb) -> bool:
+            if exc_type is None:
+                # Drain trailing tar padding so the tool can exit cleanly
+                while proc.stdout.read(COPY_BUFFER_SIZE):
+                    pass
+            else:
+                proc.kill()
+            proc.stdout.close()
+            feeder.join()
+            returncode = proc.wait()
+            with self._lock:
+                self._processes.remove(proc)
+            
+            if exc_type is None:
+                if feed_errors:
+                    raise feed_errors[0]
+                if returncode != 0:
+                    raise ExtractionError(f"{tool} failed to decompress archive (exit status {returncode})")
+            return False
+        
+        stack.push(close)
+        return proc.stdout
+    
+    @staticmethod
+    def _make_parent_dirs(target_path: str, created_dirs: Set[str]) -> None:
+        """
+        Create the parent directory of a target path once per directory.
+        
+        Args:
+            target_path: File about to be written.
+            created_dirs: Directories already created during this extraction.
+        """
+        parent = os.path.dirname(target_path)
+        if parent not in created_dirs:
+            os.makedirs(parent, exist_ok=True)
+            created_dirs.add(parent)
+    
+    @staticmethod
+    def _sendfile_member(
+        tar: tarfile.TarFile,
+        member: tarfile.TarInfo,
+        src_fd: int,
+        out_path: str
+    ) -> None:
+        """
+        Write a regular tar member by copying its data range in the kernel.
+        
+        Uses os.sendfile with explicit offsets so any number of workers can
+        share src_fd, falling back to positional reads if the kernel refuses.
+        Only valid for uncompressed, non-sparse members.
+        
+        Args:
+            tar: Open tar archive, used to apply owner, mode and mtime.
+            member: Member to write.
+            src_fd: Descriptor of the uncompressed archive.
+            out_path: Destination file path.
+            
+        Raises:
+            ExtractionError: If the archive ends inside the member data.
+        """
+        offset = member.offset_data
+        remaining = member.size
+        dst_fd = os.open(out_path, _CREATE_FLAGS, 0o600)
+        try:
+            _preallocate(dst_fd, remaining)
+            try:
+                while remaining:
+                    sent = os.sendfile(dst_fd, src_fd, offset, remaining)
+                    if not sent:
+                        raise ExtractionError(f"Unexpected end of archive in {member.name}")
+                    offset += sent
+                    remaining -= sent
+            except OSError:
+                # ENOSYS/EINVAL on filesystems without sendfile support
+                with os.fdopen(os.dup(dst_fd), 'wb', closefd=True) as dst:
+                    while remaining:
+                        chunk = os.pread(src_fd, min(COPY_BUFFER_SIZE, remaining), offset)
+                        if not chunk:
+                            raise ExtractionError(f"Unexpected end of archive in {member.name}")
+                        dst.write(chunk)
+                        offset += len(chunk)
+                        remaining -= len(chunk)
+        finally:
+            os.close(dst_fd)
+        
+        ExtractionEngine._apply_tar_attrs(tar, member, out_path)
+    
+    @staticmethod
+    def _apply_tar_attrs(tar: tarfile.TarFile, member: tarfile.TarInfo, out_path: str) -> None:
+        """
+        Apply a tar member's owner, mode and mtime to a file written outside tarfile.
+        
+        Args:
+            tar: Open tar archive.
+            member: Member the file was written from.
+            out_path: Written file path.
+        """
+        tar.chown(member, out_path, False)
+        tar.chmod(member, out_path)
+        tar.utime(member, out_path)
+    
+    @staticmethod
+    def _copy_file(src_path: Path, dst_path: Path) -> None:
+        """
+        Copy a file in the kernel, keeping shutil.copy2 semantics.
+        
+        copy_file_range lets the filesystem reflink or copy server-side when
+        source and destination share a filesystem; sendfile covers kernels
+        that refuse it, e.g. across filesystems.
+        
+        Args:
+            src_path: File to copy.
+            dst_path: Destination path.
+        """
+        try:
+            with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+                src_fd, dst_fd = src.fileno(), dst.fileno()
+                size = os.fstat(src_fd).st_size
+                offset = 0
+                
+                if hasattr(os, 'copy_file_range'):
+                    try:
+                        while offset < size:
+                            copied = os.copy_file_range(src_fd, dst_fd, size - offset, offset)
+                            if not copied:
+                                break
+                            offset += copied
+                    except OSError:
+                        # EXDEV/ENOSYS/EINVAL: continue with sendfile
+                        os.lseek(dst_fd, offset, os.SEEK_SET)
+                
+                while offset < size:
+                    sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                    if not sent:
+                        break
+                    offset += sent
+        except OSError:
+            shutil.copy2(src_path, dst_path)
+            return
+        
+        shutil.copystat(src_path, dst_path)
+    
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """
+        Return the engine's extraction thread pool, starting it on first use.
+        
+        Returns:
+            Thread pool with extract_concurrency workers, shut down by cleanup().
+        """
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.extract_concurrency,
+                    thread_name_prefix='extract'
+                )
+            return self._pool
+    
+    def _run_concurrent_extractions(
+        self,
+        extract_fn: Callable[..., None],
+        names: List[str],
+        sizes: List[int],
+        columns: Tuple[List[Any], ...],
+        done: int,
+        total_members: int,
+        tally: _ExtractionTally
+    ) -> int:
+        """
+        Extract members on the engine's thread pool.
+        
+        Member i is extracted by extract_fn(*(column[i] for column in columns)).
+        Metadata and progress are updated from the calling thread, in member
+        order, as results come back.
+        
+        Args:
+            extract_fn: Callable extracting a single member.
+            names: Member names.
+            sizes: Member data sizes, parallel to names.
+            columns: Argument lists for extract_fn, each parallel to names.
+            done: Members already processed before these.
+            total_members: Total members in the archive, for progress.
+            tally: Tally receiving metadata and progress updates.
+            
+        Returns:
+            Members processed, including those counted in done.
+        """
+        def attempt(*args) -> Optional[Exception]:
+            try:
+                extract_fn(*args)
+            except Exception as e:
+                return e
+            return None
+        
+        pool = self._get_pool()
+        futures = [pool.submit(attempt, *args) for args in zip(*columns)]
+        try:
+            for name, size, future in zip(names, sizes, futures):
+                self._check_interrupted()
+                done += 1
+                error = future.result()
+                if error is None:
+                    tally.extracted(size, name, done, total_members)
+                else:
+                    tally.failed(name, error)
+        finally:
+            # The pool outlives this call, so drain it before the caller
+            # closes the archive handles the workers are using
+            for future in futures:
+                future.cancel()
+            wait(futures)
+        
+        return done
     
     def _extract_zip(
         self,
         backup_path: Path,
         extraction_dir: Path,
         metadata: ExtractionMetadata,
-        progress_callback: Optional[Callable[[float, str], None]] = None
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        fileobj: Optional[io.RawIOBase] = None
     ) -> None:
         """
         Extract zip archive with streaming and security checks.
@@ -348,72 +1413,191 @@ class ExtractionEngine:
             extraction_dir: Target extraction directory.
             metadata: Metadata object to update.
             progress_callback: Optional progress callback function.
+            fileobj: Already-open raw binary file for the archive. Opened from
+                backup_path if None.
         """
-        with zipfile.ZipFile(backup_path, 'r') as zip_file:
+        parallel = self.extract_concurrency > 1
+        
+        with self._open_archive_stream(backup_path, fileobj) as stream, \
+                zipfile.ZipFile(stream, 'r') as zip_file:
             members = zip_file.infolist()
+            self._preflight_zip(members)
             metadata.total_files = len(members)
             metadata.total_size = sum(m.file_size for m in members if not m.is_dir())
             
-            for i, member in enumerate(members):
-                self._check_interrupted()
-                
-                # Security validation
-                if not self._validate_path_security(member.filename, extraction_dir):
-                    metadata.warnings.append(f"Skipped unsafe path: {member.filename}")
-                    continue
-                
-                # Size check
-                if member.file_size > MAX_EXTRACT_SIZE:
-                    metadata.warnings.append(f"Skipped oversized file: {member.filename}")
-                    continue
+            task_names: List[str] = []
+            task_sizes: List[int] = []
+            task_members: List[zipfile.ZipInfo] = []
+            done = 0
+            n_members = len(members)
+            extraction_root = str(extraction_dir)
+            created_dirs: Set[str] = set()
+            resolved_root = os.path.join(str(extraction_dir.resolve()), '')
+            tally = _ExtractionTally(metadata, progress_callback, max(n_members // 100, 1))
+            
+            if parallel:
+                # ZipFile reads are positional on a shared handle, so each worker
+                # opens the archive itself
+                local = threading.local()
+                worker_zips: List[zipfile.ZipFile] = []
                 
-                try:
-                    zip_file.extract(member, extraction_dir)
-                    metadata.extracted_files += 1
-                    if not member.is_dir():
-                        metadata.extracted_size += member.file_size
+                def extract_in_worker(member: zipfile.ZipInfo) -> None:
+                    worker_zip = getattr(local, 'zip_file', None)
+                    if worker_zip is None:
+                        worker_zip = local.zip_file = zipfile.ZipFile(backup_path, 'r')
+                        with self._lock:
+                            worker_zips.append(worker_zip)
+                    self._extract_zip_member(worker_zip, member, extraction_root, created_dirs)
+            
+            try:
+                for i, member in enumerate(members):
+                    self._check_interrupted()
                     
-                    # Progress callback
-                    if progress_callback:
-                        progress = (i + 1) / len(members) * 100
-                        progress_callback(progress, f"Extracted: {member.filename}")
-                        
-                except Exception as e:
-                    error_msg = f"Failed to extract {member.filename}: {e}"
-                    metadata.errors.append(error_msg)
-                    logger.error(error_msg)
+                    if not self._screen_member(member.filename, member.file_size, resolved_root, metadata):
+                        continue
+                    
+                    if parallel and not member.is_dir():
+                        task_names.append(member.filename)
+                        task_sizes.append(member.file_size)
+                        task_members.append(member)
+                        continue
+                    
+                    try:
+                        self._extract_zip_member(zip_file, member, extraction_root, created_dirs)
+                        done += 1
+                        tally.extracted(
+                            0 if member.is_dir() else member.file_size,
+                            member.filename,
+                            done if parallel else i + 1,
+                            n_members
+                        )
+                    except Exception as e:
+                        tally.failed(member.filename, e)
+                
+                if parallel:
+                    self._run_concurrent_extractions(
+                        extract_in_worker,
+                        task_names,
+                        task_sizes,
+                        (task_members,),
+                        done,
+                        n_members,
+                        tally
+                    )
+            finally:
+                tally.flush()
+                if parallel:
+                    for worker_zip in worker_zips:
+                        worker_zip.close()
+    
+    def _extract_zip_member(
+        self,
+        zip_file: zipfile.ZipFile,
+        member: zipfile.ZipInfo,
+        extraction_root: str,
+        created_dirs: Set[str]
+    ) -> None:
+        """
+        Extract a single zip member using a large copy buffer.
+        
+        ZipFile.extract copies through a small internal buffer; streaming the
+        member ourselves lets us pick the buffer size. The member path must
+        already have passed _validate_path_security.
+        
+        Args:
+            zip_file: Open zip archive.
+            member: Member to extract.
+            extraction_root: Target extraction directory.
+            created_dirs: Directories already created during this extraction.
+        """
+        target_path = os.path.join(extraction_root, member.filename)
+        
+        if member.is_dir():
+            os.makedirs(target_path, exist_ok=True)
+            created_dirs.add(os.path.dirname(target_path))
+            return
+        
+        self._make_parent_dirs(target_path, created_dirs)
+        with zip_file.open(member) as src:
+            dst_fd = os.open(target_path, _CREATE_FLAGS, 0o666)
+            try:
+                _preallocate(dst_fd, member.file_size)
+                while True:
+                    chunk = src.read(COPY_BUFFER_SIZE)
+                    if not chunk:
+                        break
+                    view = memoryview(chunk)
+                    while view:
+                        view = view[os.write(dst_fd, view):]
+            finally:
+                os.close(dst_fd)
     
     def _extract_qdrant_snapshot(
         self,
         backup_path: Path,
         extraction_dir: Path,
         metadata: ExtractionMetadata,
-        progress_callback: Optional[Callable[[float, str], None]] = None
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        fileobj: Optional[io.RawIOBase] = None
     ) -> None:
         """
         Extract Qdrant snapshot (typically tar.gz format).
         
+        The header decides the path up front. Tar snapshots, compressed or not,
+        are extracted and any tar error is reported as such. Anything else is
+        copied whole without buffering through Python.
+        
         Args:
             backup_path: Path to Qdrant snapshot.
             extraction_dir: Target extraction directory.
             metadata: Metadata object to update.
             progress_callback: Optional progress callback function.
+            fileobj: Already-open raw binary file for the archive. Opened from
+                backup_path if None.
         """
         # Qdrant snapshots are typically tar.gz files
-        try:
-            self._extract_tar(backup_path, extraction_dir, metadata, progress_callback)
-        except Exception as e:
-            # Fallback: try as regular file copy
-            logger.warning(f"Failed to extract as tar, copying as file: {e}")
-            target_path = extraction_dir / backup_path.name
-            shutil.copy2(backup_path, target_path)
-            metadata.total_files = 1
-            metadata.extracted_files = 1
-            metadata.total_size = backup_path.stat().st_size
-            metadata.extracted_size = metadata.total_size
+        if self._is_tar_snapshot(backup_path):
+            self._extract_tar(backup_path, extraction_dir, metadata, progress_callback, fileobj)
+            return
+        
+        # Not an archive: copy as a regular file
+        logger.warning(f"{backup_path.name} is not a tar archive, copying as file")
+        target_path = extraction_dir / backup_path.name
+        self._copy_file(backup_path, target_path)
+        metadata.total_files = 1
+        metadata.extracted_files = 1
+        metadata.total_size = backup_path.stat().st_size
+        metadata.extracted_size = metadata.total_size
+        
+        if progress_callback:
+            progress_callback(100.0, f"Copied: {backup_path.name}")
+    
+    @staticmethod
+    def _is_tar_snapshot(backup_path: Path) -> bool:
+        """
+        Check from its first block whether a snapshot is a tar archive.
+        
+        Args:
+            backup_path: Path to Qdrant snapshot.
             
-            if progress_callback:
-                progress_callback(100.0, f"Copied: {backup_path.name}")
+        Returns:
+            True for compressed archives and plain tar headers.
+        """
+        fd = os.open(backup_path, os.O_RDONLY)
+        try:
+            header = os.pread(fd, tarfile.BLOCKSIZE, 0)
+        finally:
+            os.close(fd)
+        
+        if TAR_COMPRESSION.get(_magic_format(header)) or header[257:262] == b'ustar':
+            return True
+        
+        # Pre-POSIX tars have no magic; a valid header checksum identifies them
+        try:
+            tarfile.TarInfo.frombuf(header, tarfile.ENCODING, 'surrogateescape')
+            return True
+        except tarfile.HeaderError:
+            return False
     
     def test_extraction(
         self,
@@ -438,100 +1622,452 @@ class ExtractionEngine:
         """
         backup_path = Path(backup_path)
         metadata = ExtractionMetadata()
+        format_detected = 'unknown'
+        extraction_path = Path()
         
         logger.info(f"Starting extraction test for: {backup_path}")
         
         try:
-            # Validate input file
-            if not backup_path.exists():
-                raise ExtractionError(f"Backup file not found: {backup_path}")
-            
-            if not backup_path.is_file():
-                raise ExtractionError(f"Path is not a file: {backup_path}")
+            format_detected, extraction_path = self._prepare_extraction(backup_path, extraction_dir)
             
-            # Detect format
-            format_detected = self._detect_format(backup_path)
-            logger.info(f"Detected format: {format_detected}")
+            # Perform extraction based on format. The archive is read once and
+            # checksummed by the HashingReader as extraction consumes it.
+            if progress_callback:
+                progress_callback(5.0, "Starting extraction...")
             
-            # Setup extraction directory
-            if extraction_dir is None:
-                extraction_path = self._create_secure_temp_dir()
-                temp_created = True
-            else:
-                extraction_path = Path(extraction_dir)
-                extraction_path.mkdir(parents=True, exist_ok=True)
-                temp_created = False
+            with open(backup_path, 'rb', buffering=0) as raw, _read_once(raw.fileno()):
+                hashing_reader = HashingReader(raw, self._check_interrupted, self._new_hasher())
+                
+                if format_detected in TAR_FORMATS:
+                    self._extract_tar(backup_path, extraction_path, metadata, progress_callback, hashing_reader)
+                elif format_detected == 'zip':
+                    self._extract_zip(backup_path, extraction_path, metadata, progress_callback, hashing_reader)
+                elif format_detected == 'qdrant':
+                    self._extract_qdrant_snapshot(
+                        backup_path, extraction_path, metadata, progress_callback, hashing_reader
+                    )
+                else:
+                    raise ExtractionError(f"Unsupported format: {format_detected}")
+                
+                original_checksum = hashing_reader.hexdigest()
             
-            logger.info(f"Extracting to: {extraction_path}")
+            return self._completed_result(
+                extraction_path, metadata, format_detected, original_checksum, progress_callback
+            )
             
-            # Calculate original checksum
-            if progress_callback:
-                progress_callback(0.0, "Calculating checksum...")
+        except Exception as e:
+            return self._failed_result(e, extraction_path, metadata, format_detected)
+    
+    async def async_extract(
+        self,
+        backup_path: Union[str, Path],
+        extraction_dir: Optional[Union[str, Path]] = None,
+        progress_callback: Optional[Callable[[float, str], None]] = None
+    ) -> ExtractionResult:
+        """
+        Asynchronous variant of test_extraction that overlaps reading and writing.
+        
+        A producer thread reads and decompresses members into a queue bounded
+        at PIPELINE_DEPTH chunks while a consumer thread writes them to disk,
+        so decompression and disk writes proceed concurrently. The archive
+        checksum is computed by a third task on its own file handle. The
+        progress callback is invoked from the writer thread.
+        
+        Args:
+            backup_path: Path to backup file to extract.
+            extraction_dir: Target directory for extraction. Creates temp dir if None.
+            progress_callback: Optional callback for progress updates (progress%, message).
             
-            original_checksum = self._calculate_checksum(backup_path)
+        Returns:
+            ExtractionResult with detailed extraction information.
+        """
+        backup_path = Path(backup_path)
+        metadata = ExtractionMetadata()
+        format_detected = 'unknown'
+        extraction_path = Path()
+        
+        logger.info(f"Starting extraction test for: {backup_path}")
+        
+        try:
+            format_detected, extraction_path = self._prepare_extraction(backup_path, extraction_dir)
             
-            # Perform extraction based on format
             if progress_callback:
                 progress_callback(5.0, "Starting extraction...")
             
-            if format_detected in ['tar', 'tar.gz', 'tar.bz2', 'tar.xz']:
-                self._extract_tar(backup_path, extraction_path, metadata, progress_callback)
-            elif format_detected == 'zip':
-                self._extract_zip(backup_path, extraction_path, metadata, progress_callback)
-            elif format_detected == 'qdrant':
-                self._extract_qdrant_snapshot(backup_path, extraction_path, metadata, progress_callback)
-            else:
-                raise ExtractionError(f"Unsupported format: {format_detected}")
-            
-            metadata.end_time = time.time()
+            checksum_task = asyncio.create_task(asyncio.to_thread(self._calculate_checksum, backup_path))
+            try:
+                if format_detected == 'zip':
+                    produce = self._produce_zip_members
+                elif format_detected in TAR_FORMATS or (
+                        format_detected == 'qdrant' and self._is_tar_snapshot(backup_path)):
+                    produce = self._produce_tar_members
+                elif format_detected == 'qdrant':
+                    produce = None
+                    await asyncio.to_thread(
+                        self._extract_qdrant_snapshot, backup_path, extraction_path, metadata, progress_callback
+                    )
+                else:
+                    raise ExtractionError(f"Unsupported format: {format_detected}")
+                
+                if produce is not None:
+                    await self._run_pipeline(produce, backup_path, extraction_path, metadata, progress_callback)
+            except BaseException:
+                checksum_task.cancel()
+                raise
             
-            if progress_callback:
-                progress_callback(100.0, "Extraction completed")
-            
-            # Create successful result
-            result = ExtractionResult(
-                success=True,
-                extraction_path=extraction_path,
-                metadata=metadata,
-                format_detected=format_detected,
-                file_count=metadata.extracted_files,
-                total_size=metadata.extracted_size,
-                checksum=original_checksum
+            original_checksum = await checksum_task
+            return self._completed_result(
+                extraction_path, metadata, format_detected, original_checksum, progress_callback
             )
             
-            logger.info(f"Extraction completed successfully: {metadata.extracted_files} files, "
-                       f"{metadata.extracted_size} bytes in {metadata.duration:.2f}s")
+        except Exception as e:
+            return self._failed_result(e, extraction_path, metadata, format_detected)
+    
+    def _prepare_extraction(
+        self,
+        backup_path: Path,
+        extraction_dir: Optional[Union[str, Path]]
+    ) -> Tuple[str, Path]:
+        """
+        Validate the backup, detect its format and set up the extraction directory.
+        
+        Args:
+            backup_path: Path to backup file to extract.
+            extraction_dir: Target directory for extraction. Creates temp dir if None.
             
-            return result
+        Returns:
+            Tuple of (detected format, extraction directory).
             
-        except Exception as e:
-            metadata.end_time = time.time()
-            error_message = str(e)
-            metadata.errors.append(error_message)
-            
-            logger.error(f"Extraction failed: {error_message}")
-            
-            # Create failed result
-            result = ExtractionResult(
-                success=False,
-                extraction_path=extraction_path if 'extraction_path' in locals() else Path(),
-                metadata=metadata,
-                format_detected=format_detected if 'format_detected' in locals() else 'unknown',
-                file_count=metadata.extracted_files,
-                total_size=metadata.extracted_size,
-                error_message=error_message
+        Raises:
+            ExtractionError: If the backup is missing or its format is unsupported.
+        """
+        # Validate input file
+        if not backup_path.exists():
+            raise ExtractionError(f"Backup file not found: {backup_path}")
+        
+        if not backup_path.is_file():
+            raise ExtractionError(f"Path is not a file: {backup_path}")
+        
+        # Detect format
+        format_detected = self._detect_format(backup_path)
+        logger.info(f"Detected format: {format_detected}")
+        
+        # Setup extraction directory
+        if extraction_dir is None:
+            extraction_path = self._create_secure_temp_dir()
+        else:
+            extraction_path = Path(extraction_dir)
+            extraction_path.mkdir(parents=True, exist_ok=True)
+        
+        logger.info(f"Extracting to: {extraction_path}")
+        return format_detected, extraction_path
+    
+    @staticmethod
+    def _completed_result(
+        extraction_path: Path,
+        metadata: ExtractionMetadata,
+        format_detected: str,
+        checksum: str,
+        progress_callback: Optional[Callable[[float, str], None]] = None
+    ) -> ExtractionResult:
+        """
+        Finish a successful extraction and build its result.
+        
+        Args:
+            extraction_path: Directory the archive was extracted to.
+            metadata: Metadata collected during extraction.
+            format_detected: Detected archive format.
+            checksum: Checksum of the backup file.
+            progress_callback: Optional progress callback function.
+            
+        Returns:
+            Successful ExtractionResult.
+        """
+        metadata.end_time = time.time()
+        
+        if progress_callback:
+            progress_callback(100.0, "Extraction completed")
+        
+        # Create successful result
+        result = ExtractionResult(
+            success=True,
+            extraction_path=extraction_path,
+            metadata=metadata,
+            format_detected=format_detected,
+            file_count=metadata.extracted_files,
+            total_size=metadata.extracted_size,
+            checksum=checksum
+        )
+        
+        logger.info(f"Extraction completed successfully: {metadata.extracted_files} files, "
+                   f"{metadata.extracted_size} bytes in {metadata.duration:.2f}s")
+        
+        return result
+    
+    @staticmethod
+    def _failed_result(
+        error: Exception,
+        extraction_path: Path,
+        metadata: ExtractionMetadata,
+        format_detected: str
+    ) -> ExtractionResult:
+        """
+        Record an extraction failure and build its result.
+        
+        Args:
+            error: Exception that ended the extraction.
+            extraction_path: Extraction directory, empty Path if not created yet.
+            metadata: Metadata collected during extraction.
+            format_detected: Detected archive format, 'unknown' if not detected yet.
+            
+        Returns:
+            Failed ExtractionResult.
+        """
+        metadata.end_time = time.time()
+        error_message = str(error)
+        metadata.errors.append(error_message)
+        
+        logger.error(f"Extraction failed: {error_message}")
+        
+        # Create failed result
+        return ExtractionResult(
+            success=False,
+            extraction_path=extraction_path,
+            metadata=metadata,
+            format_detected=format_detected,
+            file_count=metadata.extracted_files,
+            total_size=metadata.extracted_size,
+            error_message=error_message
+        )
+    
+    async def _run_pipeline(
+        self,
+        produce: Callable[..., None],
+        backup_path: Path,
+        extraction_dir: Path,
+        metadata: ExtractionMetadata,
+        progress_callback: Optional[Callable[[float, str], None]] = None
+    ) -> None:
+        """
+        Run a member producer and the file writer concurrently.
+        
+        Args:
+            produce: _produce_tar_members or _produce_zip_members.
+            backup_path: Path to archive.
+            extraction_dir: Target extraction directory.
+            metadata: Metadata object to update.
+            progress_callback: Optional progress callback function.
+        """
+        work: queue.Queue = queue.Queue(maxsize=PIPELINE_DEPTH)
+        tally = _ExtractionTally(metadata, progress_callback)
+        
+        def run_producer() -> None:
+            try:
+                produce(backup_path, extraction_dir, metadata, work)
+            finally:
+                # The writer drains until this sentinel, so it always arrives
+                work.put(None)
+        
+        try:
+            await asyncio.gather(
+                asyncio.to_thread(run_producer),
+                asyncio.to_thread(self._consume_members, work, tally)
             )
+        finally:
+            tally.flush()
+    
+    def _produce_tar_members(
+        self,
+        backup_path: Path,
+        extraction_dir: Path,
+        metadata: ExtractionMetadata,
+        work: queue.Queue
+    ) -> None:
+        """
+        Read a tar archive and queue its members for _consume_members.
+        
+        Regular file data is queued in COPY_BUFFER_SIZE chunks. Other members
+        are extracted here, links only once the writer has caught up.
+        
+        Args:
+            backup_path: Path to tar archive.
+            extraction_dir: Target extraction directory.
+            metadata: Metadata object receiving warnings.
+            work: Queue feeding the writer.
+        """
+        compression = self._sniff_compression(backup_path)
+        archive_size = max(backup_path.stat().st_size, 1)
+        extraction_root = str(extraction_dir)
+        resolved_root = os.path.join(str(extraction_dir.resolve()), '')
+        link_paths: Set[str] = set()
+        seen_files = seen_size = budget_used = 0
+        
+        with ExitStack() as stack:
+            stream = stack.enter_context(self._open_archive_stream(backup_path))
+            tar_source, mode = self._open_tar_source(stream, compression, stack)
+            tar = stack.enter_context(tarfile.open(
+                fileobj=tar_source,
+                mode=mode,
+                bufsize=COPY_BUFFER_SIZE,
+                copybufsize=COPY_BUFFER_SIZE
+            ))
             
-            return result
+            for member in tar:
+                self._check_interrupted()
+                seen_files += 1
+                if member.isfile():
+                    seen_size += member.size
+                
+                if not self._screen_member(member.name, member.size, resolved_root, metadata, link_paths, member.issym()):
+                    continue
+                
+                if member.isfile():
+                    budget_used += member.size
+                    self._check_extraction_budget(budget_used, archive_size)
+                
+                try:
+                    if member.isreg():
+                        source = tar.extractfile(member)
+                        work.put(('begin', member.name, os.path.join(extraction_root, member.name), member.size))
+                        while chunk := source.read(COPY_BUFFER_SIZE):
+                            work.put(('data', chunk))
+                        work.put(('end', member.size, stream.tell(), archive_size, partial(self._apply_tar_attrs, tar, member)))
+                    else:
+                        if member.islnk() or member.issym():
+                            # Let the writer catch up so hard links find their
+                            # targets and no queued write lands behind a new symlink
+                            work.join()
+                        tar.extract(member, extraction_dir)
+                        work.put(('done', member.name, stream.tell(), archive_size))
+                except Exception as e:
+                    work.put(('error', member.name, e))
+        
+        work.put(('seen', seen_files, seen_size))
+    
+    def _produce_zip_members(
+        self,
+        backup_path: Path,
+        extraction_dir: Path,
+        metadata: ExtractionMetadata,
+        work: queue.Queue
+    ) -> None:
+        """
+        Read a zip archive and queue its members for _consume_members.
+        
+        Args:
+            backup_path: Path to zip archive.
+            extraction_dir: Target extraction directory.
+            metadata: Metadata object receiving warnings.
+            work: Queue feeding the writer.
+        """
+        extraction_root = str(extraction_dir)
+        resolved_root = os.path.join(str(extraction_dir.resolve()), '')
+        
+        with zipfile.ZipFile(backup_path, 'r') as zip_file:
+            members = zip_file.infolist()
+            self._preflight_zip(members)
+            n_members = len(members)
+            work.put(('seen', n_members, sum(m.file_size for m in members if not m.is_dir())))
+            
+            for i, member in enumerate(members):
+                self._check_interrupted()
+                
+                if not self._screen_member(member.filename, member.file_size, resolved_root, metadata):
+                    continue
+                
+                target_path = os.path.join(extraction_root, member.filename)
+                try:
+                    if member.is_dir():
+                        os.makedirs(target_path, exist_ok=True)
+                        work.put(('done', member.filename, i + 1, n_members))
+                        continue
+                    
+                    with zip_file.open(member) as source:
+                        work.put(('begin', member.filename, target_path, member.file_size))
+                        while chunk := source.read(COPY_BUFFER_SIZE):
+                            work.put(('data', chunk))
+                    work.put(('end', member.file_size, i + 1, n_members, None))
+                except Exception as e:
+                    work.put(('error', member.filename, e))
+    
+    def _consume_members(self, work: queue.Queue, tally: _ExtractionTally) -> None:
+        """
+        Write queued members to disk until the producer's None sentinel.
+        
+        Items are ('begin', name, path, size), ('data', chunk), ('end', size,
+        done, total, finish), ('done', name, done, total), ('error', name, exc)
+        and ('seen', count, size). A failed write skips the rest of that member.
+        
+        Args:
+            work: Queue filled by a member producer.
+            tally: Tally receiving metadata and progress updates.
+        """
+        created_dirs: Set[str] = set()
+        dst_fd: Optional[int] = None
+        name = target_path = ''
+        
+        while True:
+            item = work.get()
+            try:
+                if item is None:
+                    break
+                kind = item[0]
+                
+                if kind == 'data':
+                    if dst_fd is not None:
+                        view = memoryview(item[1])
+                        while view:
+                            view = view[os.write(dst_fd, view):]
+                elif kind == 'begin':
+                    _, name, target_path, size = item
+                    self._make_parent_dirs(target_path, created_dirs)
+                    dst_fd = os.open(target_path, _CREATE_FLAGS, 0o666)
+                    _preallocate(dst_fd, size)
+                elif kind == 'end':
+                    _, size, done, total, finish = item
+                    if dst_fd is not None:
+                        fd, dst_fd = dst_fd, None
+                        os.close(fd)
+                        if finish is not None:
+                            finish(target_path)
+                        tally.extracted(size, name, done, total)
+                elif kind == 'done':
+                    _, member_name, done, total = item
+                    tally.extracted(0, member_name, done, total)
+                elif kind == 'error':
+                    if dst_fd is not None:
+                        fd, dst_fd = dst_fd, None
+                        os.close(fd)
+                    tally.failed(item[1], item[2])
+                elif kind == 'seen':
+                    tally.seen(item[2], item[1])
+                    
+            except Exception as e:
+                if dst_fd is not None:
+                    fd, dst_fd = dst_fd, None
+                    os.close(fd)
+                tally.failed(name, e)
+            finally:
+                work.task_done()
     
     def cleanup(self) -> None:
         """Clean up temporary directories and resources."""
         with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        
+        with self._lock:
+            for proc in self._processes:
+                proc.kill()
+                proc.wait()
+            self._processes.clear()
+            
             for temp_dir in self.temp_dirs:
                 try:
                     if temp_dir.exists():
                         shutil.rmtree(temp_dir)
-                        logger.debug(f"Cleaned up temp directory: {temp_dir}")
+                        logger.debug("Cleaned up temp directory: %s", temp_dir)
                 except Exception as e:
                     logger.warning(f"Failed to cleanup {temp_dir}: {e}")
             
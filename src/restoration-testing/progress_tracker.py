@@ -11,10 +11,12 @@ This module provides a comprehensive progress tracking system with support for:
 
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Optional, Callable, Dict, Any, List, Union
+from typing import Optional, Callable, Deque, Dict, Any, List, Mapping, Tuple, Union
 from enum import Enum
 from contextlib import contextmanager
+from types import MappingProxyType
 import sys
 
 
@@ -32,7 +34,16 @@ class ProgressUnit(Enum):
     PERCENT = "percent"
 
 
-@dataclass
+# Shared read-only sub_operations for reports of trackers without sub-operations
+_NO_SUB_REPORTS: Mapping[str, 'ProgressReport'] = MappingProxyType({})
+
+
+# Reports are immutable so cached ones can be handed to every caller;
+# slots, where available, drop the per-instance __dict__
+_REPORT_OPTIONS = {'frozen': True, 'slots': True} if sys.version_info >= (3, 10) else {'frozen': True}
+
+
+@dataclass(**_REPORT_OPTIONS)
 class ProgressReport:
     """Data class for progress status updates."""
     operation_id: str
@@ -44,7 +55,7 @@ class ProgressReport:
     throughput: Optional[float] = None
     throughput_unit: str = "items/sec"
     custom_message: str = ""
-    sub_operations: Dict[str, 'ProgressReport'] = field(default_factory=dict)
+    sub_operations: Mapping[str, 'ProgressReport'] = field(default_factory=dict)
     
     @property
     def is_complete(self) -> bool:
@@ -57,6 +68,19 @@ class ProgressReport:
         return max(0, self.total - self.current)
 
 
+# Console progress bars, indexed by the number of filled cells
+BAR_LENGTH = 40
+_BARS = tuple('█' * filled + '░' * (BAR_LENGTH - filled) for filled in range(BAR_LENGTH + 1))
+_BAR_BYTES = tuple(bar.encode('utf-8') for bar in _BARS)
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+_THROUGHPUT_UNITS = {
+    ProgressUnit.BYTES: "bytes/sec",
+    ProgressUnit.ITEMS: "items/sec",
+}
+
+
 class ProgressTracker:
     """
     Thread-safe progress tracker with support for nested operations and multiple display modes.
@@ -99,26 +123,59 @@ class ProgressTracker:
         self.unit = unit
         self.custom_format = custom_format
         
-        # Thread safety
-        self._lock = threading.RLock()
+        # Thread safety. _count_lock only guards the counters so the common
+        # update that does not report never waits on a report in progress.
+        # _lock guards reports and console output; it is never held while
+        # notifying the parent, so locks are only ever taken parent first.
+        self._lock = threading.Lock()
+        self._count_lock = threading.Lock()
         
         # Progress state
         self._current_item = 0
         self._start_time: Optional[float] = None
         self._last_update_time = 0.0
+        self._next_update_time = 0.0
         self._custom_message = ""
         self._is_finished = False
         
+        # Change tracking for observers such as MultiProgressTracker. The
+        # version is bumped on every change; listeners run on every report.
+        self._version = 0
+        self._listeners: List[Callable[[], None]] = []
+        
         # Nested operations
         self._sub_trackers: Dict[str, 'ProgressTracker'] = {}
         self._parent_tracker: Optional['ProgressTracker'] = None
         
         # Performance metrics
-        self._throughput_samples: List[tuple] = []  # (timestamp, items_processed)
         self._max_samples = 10
-        
-        # Console state
+        # (timestamp, items_processed)
+        self._throughput_samples: Deque[Tuple[float, int]] = deque(maxlen=self._max_samples)
+        self._stats_sample: Optional[Tuple[float, int]] = None
+        self._stats_item = 0
+        self._stats: Tuple[Optional[float], Optional[float]] = (None, None)
+        
+        # Console state. Progress lines have no newline, which line buffering
+        # never flushes, so terminals are flushed at most once per update_interval
+        # and redirected output only when its buffer fills or the operation finishes.
         self._last_console_length = 0
+        self._console_is_tty = mode == ProgressMode.CONSOLE and sys.stdout.isatty()
+        self._last_flush_time = 0.0
+        
+        # Default-format lines go to a UTF-8 terminal as bytes with the bar
+        # pre-encoded. Line buffering or write-through keeps other prints from
+        # sitting in the text layer, so they stay in order with those bytes.
+        self._console_bytes = (
+            self._console_is_tty
+            and (getattr(sys.stdout, 'line_buffering', False) or getattr(sys.stdout, 'write_through', False))
+            and hasattr(sys.stdout, 'buffer')
+            and (sys.stdout.encoding or '').lower().replace('-', '') == 'utf8'
+        )
+        
+        # Cached report values
+        self._throughput_unit = _THROUGHPUT_UNITS.get(unit, "units/sec")
+        self._report_key: Optional[tuple] = None
+        self._report: Optional[ProgressReport] = None
         
     def start(self) -> None:
         """Start progress tracking."""
@@ -126,14 +183,19 @@ class ProgressTracker:
             if self._start_time is not None:
                 return  # Already started
                 
-            self._start_time = time.time()
-            self._last_update_time = self._start_time
-            self._throughput_samples = [(self._start_time, 0)]
+            current_time = time.monotonic()
+            self._start_time = current_time
+            self._last_update_time = current_time
+            self._next_update_time = current_time + self.update_interval
+            with self._count_lock:
+                self._throughput_samples.clear()
+                self._throughput_samples.append((current_time, 0))
+                self._version += 1
             
             if self.mode == ProgressMode.CONSOLE:
                 self._print_initial_message()
-            
-            self._notify_update()
+        
+        self._notify_update(current_time)
     
     def update(self, items_processed: int = 1, custom_message: str = "") -> None:
         """
@@ -143,25 +205,32 @@ class ProgressTracker:
             items_processed: Number of items processed since last update
             custom_message: Custom message to display
         """
-        with self._lock:
-            if self._start_time is None:
-                self.start()
-            
-            self._current_item = min(self._current_item + items_processed, self.total_items)
+        if self._start_time is None:
+            self.start()
+        
+        with self._count_lock:
+            # Work on locals; this runs for every processed item
+            current_item = self._current_item + items_processed
+            total_items = self.total_items
+            if current_item > total_items:
+                current_item = total_items
+            self._current_item = current_item
             if custom_message:
                 self._custom_message = custom_message
+            self._version += 1
             
-            current_time = time.time()
+            current_time = time.monotonic()
             
-            # Update throughput samples
-            self._throughput_samples.append((current_time, self._current_item))
-            if len(self._throughput_samples) > self._max_samples:
-                self._throughput_samples.pop(0)
+            # Update throughput samples; the deque drops the oldest itself
+            self._throughput_samples.append((current_time, current_item))
             
             # Check if enough time has passed for update
-            if current_time - self._last_update_time >= self.update_interval:
-                self._last_update_time = current_time
-                self._notify_update()
+            if current_time < self._next_update_time:
+                return
+            self._last_update_time = current_time
+            self._next_update_time = current_time + self.update_interval
+        
+        self._notify_update(current_time)
     
     def set_current(self, current_item: int, custom_message: str = "") -> None:
         """
@@ -171,25 +240,27 @@ class ProgressTracker:
             current_item: Current item number (absolute position)
             custom_message: Custom message to display
         """
-        with self._lock:
-            if self._start_time is None:
-                self.start()
-            
+        if self._start_time is None:
+            self.start()
+        
+        with self._count_lock:
             self._current_item = min(max(0, current_item), self.total_items)
             if custom_message:
                 self._custom_message = custom_message
+            self._version += 1
             
-            current_time = time.time()
+            current_time = time.monotonic()
             
-            # Update throughput samples
+            # Update throughput samples; the deque drops the oldest itself
             self._throughput_samples.append((current_time, self._current_item))
-            if len(self._throughput_samples) > self._max_samples:
-                self._throughput_samples.pop(0)
             
             # Check if enough time has passed for update
-            if current_time - self._last_update_time >= self.update_interval:
-                self._last_update_time = current_time
-                self._notify_update()
+            if current_time < self._next_update_time:
+                return
+            self._last_update_time = current_time
+            self._next_update_time = current_time + self.update_interval
+        
+        self._notify_update(current_time)
     
     def finish(self, custom_message: str = "Complete") -> None:
         """
@@ -202,14 +273,20 @@ class ProgressTracker:
             if self._is_finished:
                 return
             
-            self._current_item = self.total_items
-            self._custom_message = custom_message
+            with self._count_lock:
+                self._current_item = self.total_items
+                self._custom_message = custom_message
+                self._version += 1
             self._is_finished = True
             
+            current_time = time.monotonic()
             if self.mode == ProgressMode.CONSOLE:
-                self._print_final_message()
-            
-            self._notify_update()
+                self._print_final_message(current_time)
+        
+        self._notify_update(current_time, final=True)
+        
+        if self.mode == ProgressMode.CONSOLE:
+            sys.stdout.flush()
     
     def add_sub_operation(
         self,
@@ -228,58 +305,89 @@ class ProgressTracker:
         Returns:
             ProgressTracker instance for sub-operation
         """
+        # Default to silent mode for sub-operations unless specified
+        if 'mode' not in kwargs:
+            kwargs['mode'] = ProgressMode.SILENT
+        
+        sub_tracker = ProgressTracker(
+            operation_id=f"{self.operation_id}.{sub_id}",
+            total_items=total_items,
+            **kwargs
+        )
+        sub_tracker._parent_tracker = self
+        
+        # Reports iterate the sub-trackers under the lock
         with self._lock:
-            # Default to silent mode for sub-operations unless specified
-            if 'mode' not in kwargs:
-                kwargs['mode'] = ProgressMode.SILENT
-            
-            sub_tracker = ProgressTracker(
-                operation_id=f"{self.operation_id}.{sub_id}",
-                total_items=total_items,
-                **kwargs
-            )
-            sub_tracker._parent_tracker = self
             self._sub_trackers[sub_id] = sub_tracker
-            
-            return sub_tracker
+        
+        return sub_tracker
     
-    def get_report(self) -> ProgressReport:
+    def get_report(self, now: Optional[float] = None) -> ProgressReport:
         """
         Get current progress report.
         
+        Args:
+            now: time.monotonic() timestamp the caller already took, if any
+        
         Returns:
             ProgressReport with current status
         """
         with self._lock:
-            elapsed_time = 0.0
-            if self._start_time is not None:
-                elapsed_time = time.time() - self._start_time
-            
-            percentage = (self._current_item / self.total_items * 100) if self.total_items > 0 else 0.0
-            
-            # Calculate ETA
-            eta = self._calculate_eta()
-            
-            # Calculate throughput
-            throughput, throughput_unit = self._calculate_throughput()
-            
-            # Get sub-operation reports
-            sub_reports = {}
-            for sub_id, sub_tracker in self._sub_trackers.items():
-                sub_reports[sub_id] = sub_tracker.get_report()
-            
-            return ProgressReport(
-                operation_id=self.operation_id,
-                current=self._current_item,
-                total=self.total_items,
-                percentage=percentage,
-                elapsed_time=elapsed_time,
-                eta=eta,
-                throughput=throughput,
-                throughput_unit=throughput_unit,
-                custom_message=self._custom_message,
-                sub_operations=sub_reports
-            )
+            return self._build_report(now)
+    
+    def _build_report(self, now: Optional[float] = None) -> ProgressReport:
+        """
+        Build the current progress report. The caller must hold self._lock.
+        
+        Args:
+            now: time.monotonic() timestamp the caller already took, if any
+        
+        Returns:
+            ProgressReport with current status
+        """
+        elapsed_time = 0.0
+        if self._start_time is not None:
+            if now is None:
+                now = time.monotonic()
+            elapsed_time = now - self._start_time
+        
+        # Reports only change meaningfully with progress, so one is reused
+        # for the rest of its decisecond. Sub-operations progress on their
+        # own, so trackers with any are always rebuilt.
+        report_key = (self._current_item, int(elapsed_time * 10), self._custom_message)
+        if report_key == self._report_key and not self._sub_trackers:
+            return self._report
+        
+        percentage = (self._current_item / self.total_items * 100) if self.total_items > 0 else 0.0
+        
+        # Calculate throughput and ETA
+        throughput, eta = self._recent_stats()
+        throughput_unit = self._throughput_unit
+        
+        # Get sub-operation reports
+        if self._sub_trackers:
+            sub_reports = {
+                sub_id: sub_tracker.get_report(now)
+                for sub_id, sub_tracker in self._sub_trackers.items()
+            }
+        else:
+            sub_reports = _NO_SUB_REPORTS
+        
+        report = ProgressReport(
+            operation_id=self.operation_id,
+            current=self._current_item,
+            total=self.total_items,
+            percentage=percentage,
+            elapsed_time=elapsed_time,
+            eta=eta,
+            throughput=throughput,
+            throughput_unit=throughput_unit,
+            custom_message=self._custom_message,
+            sub_operations=sub_reports
+        )
+        self._report_key = report_key
+        self._report = report
+        return report
     
     @contextmanager
     def operation_context(self):
@@ -291,83 +399,112 @@ class ProgressTracker:
             if not self._is_finished:
                 self.finish()
     
-    def _calculate_eta(self) -> Optional[float]:
-        """Calculate estimated time to completion."""
-        if len(self._throughput_samples) < 2 or self._current_item == 0:
-            return None
-        
-        # Use recent samples for ETA calculation
-        recent_samples = self._throughput_samples[-3:]
-        if len(recent_samples) < 2:
-            return None
-        
-        time_diff = recent_samples[-1][0] - recent_samples[0][0]
-        items_diff = recent_samples[-1][1] - recent_samples[0][1]
+    def _recent_stats(self) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Calculate current throughput and estimated time to completion.
         
-        if time_diff <= 0 or items_diff <= 0:
-            return None
+        Both come from the last three samples. The result is cached until a
+        new sample arrives or the current item changes.
         
-        items_per_second = items_diff / time_diff
-        remaining_items = self.total_items - self._current_item
+        Returns:
+            (throughput, eta) tuple, either of which may be None
+        """
+        samples = self._throughput_samples
+        if len(samples) < 2:
+            return None, None
         
-        return remaining_items / items_per_second if items_per_second > 0 else None
-    
-    def _calculate_throughput(self) -> tuple[Optional[float], str]:
-        """Calculate current throughput."""
-        if len(self._throughput_samples) < 2:
-            return None, self._get_throughput_unit()
+        last_sample = samples[-1]
+        current_item = self._current_item
+        if last_sample is self._stats_sample and current_item == self._stats_item:
+            return self._stats
         
-        # Use recent samples for throughput calculation
-        recent_samples = self._throughput_samples[-3:]
-        if len(recent_samples) < 2:
-            return None, self._get_throughput_unit()
+        first_time, first_items = samples[-min(len(samples), 3)]
+        last_time, last_items = last_sample
         
-        time_diff = recent_samples[-1][0] - recent_samples[0][0]
-        items_diff = recent_samples[-1][1] - recent_samples[0][1]
+        time_diff = last_time - first_time
+        items_diff = last_items - first_items
         
-        if time_diff <= 0:
-            return None, self._get_throughput_unit()
+        throughput = eta = None
+        if time_diff > 0:
+            throughput = items_diff / time_diff
+            if items_diff > 0 and current_item > 0:
+                eta = (self.total_items - current_item) / throughput
         
-        throughput = items_diff / time_diff
-        return throughput, self._get_throughput_unit()
+        self._stats_sample = last_sample
+        self._stats_item = current_item
+        self._stats = (throughput, eta)
+        return self._stats
     
     def _get_throughput_unit(self) -> str:
         """Get appropriate throughput unit string."""
-        if self.unit == ProgressUnit.BYTES:
-            return "bytes/sec"
-        elif self.unit == ProgressUnit.ITEMS:
-            return "items/sec"
-        else:
-            return "units/sec"
+        return self._throughput_unit
     
-    def _notify_update(self) -> None:
-        """Notify about progress update."""
-        report = self.get_report()
+    def _child_update_due(self, now: float, final: bool = False) -> bool:
+        """
+        Decide whether a sub-operation's update should refresh this tracker.
+        
+        Sub-operation updates share this tracker's update_interval with its own,
+        so fast sub-operations cannot make the parent report more often.
+        Every update still bumps this tracker's version, since its report
+        embeds the sub-operation's, so a monitor's next tick picks up the
+        updates that were not reported.
+        
+        Args:
+            now: time.monotonic() timestamp of the sub-operation's update
+            final: Whether the sub-operation finished, which always refreshes
+        
+        Returns:
+            True if this tracker should notify now
+        """
+        with self._count_lock:
+            self._version += 1
+            if not final and now < self._next_update_time:
+                return False
+            self._last_update_time = now
+            self._next_update_time = now + self.update_interval
+            return True
+    
+    def _notify_update(self, now: Optional[float] = None, final: bool = False) -> None:
+        """
+        Notify about progress update.
+        
+        Args:
+            now: time.monotonic() timestamp of the update, taken here if None
+            final: Whether this is the operation's last update
+        """
+        if now is None:
+            now = time.monotonic()
         
         # Notify parent if this is a sub-operation
-        if self._parent_tracker:
-            self._parent_tracker._notify_update()
+        parent = self._parent_tracker
+        if parent is not None and parent._child_update_due(now, final):
+            parent._notify_update(now)
         
-        # Handle different modes
-        if self.mode == ProgressMode.CONSOLE:
-            self._print_progress(report)
-        elif self.mode == ProgressMode.CALLBACK and self.callback:
-            self.callback(report)
+        for listener in self._listeners:
+            listener()
+        
+        # Only build a report if something will display it. Callbacks run
+        # outside the lock so they may query the tracker themselves.
+        if self.mode is ProgressMode.CONSOLE:
+            with self._lock:
+                self._print_progress(self._build_report(now), now)
+        elif self.mode is ProgressMode.CALLBACK and self.callback:
+            self.callback(self.get_report(now))
     
     def _print_initial_message(self) -> None:
         """Print initial progress message."""
         print(f"\nStarting: {self.operation_id}")
         print(f"Total items: {self.total_items:,}")
     
-    def _print_progress(self, report: ProgressReport) -> None:
+    def _print_progress(self, report: ProgressReport, now: float) -> None:
         """Print progress to console."""
+        filled_length = None
         if self.custom_format:
             message = self.custom_format.format(report=report)
+            length = len(message)
         else:
             # Default format
-            bar_length = 40
-            filled_length = int(bar_length * report.percentage / 100)
-            bar = '█' * filled_length + '░' * (bar_length - filled_length)
+            filled_length = int(BAR_LENGTH * report.percentage / 100)
             
             # Format throughput
             throughput_str = ""
@@ -385,23 +522,38 @@ class ProgressTracker:
             # Format custom message
             custom_str = f" | {report.custom_message}" if report.custom_message else ""
             
+            # The text either side of the bar, which is added when writing
+            head = f"\r{self.operation_id}: ["
             message = (
-                f"\r{self.operation_id}: [{bar}] "
-                f"{report.percentage:5.1f}% "
+                f"] {report.percentage:5.1f}% "
                 f"({report.current:,}/{report.total:,})"
                 f"{throughput_str}{eta_str}{custom_str}"
             )
+            length = len(head) + BAR_LENGTH + len(message)
         
         # Clear previous line if needed
-        if len(message) < self._last_console_length:
-            message += " " * (self._last_console_length - len(message))
+        if length < self._last_console_length:
+            message += " " * (self._last_console_length - length)
+        else:
+            self._last_console_length = length
         
-        self._last_console_length = len(message)
-        print(message, end='', flush=True)
-    
-    def _print_final_message(self) -> None:
-        """Print final completion message."""
-        report = self.get_report()
+        if filled_length is None:
+            sys.stdout.write(message)
+        elif self._console_bytes:
+            sys.stdout.buffer.write(head.encode() + _BAR_BYTES[filled_length] + message.encode())
+        else:
+            sys.stdout.write(head + _BARS[filled_length] + message)
+        self._maybe_flush(now)
+    
+    def _maybe_flush(self, now: float) -> None:
+        """Flush the console if it is a terminal and a flush is due."""
+        if self._console_is_tty and now - self._last_flush_time >= self.update_interval:
+            self._last_flush_time = now
+            sys.stdout.flush()
+    
+    def _print_final_message(self, now: Optional[float] = None) -> None:
+        """Print final completion message. The caller must hold self._lock."""
+        report = self._build_report(now)
         print()  # New line after progress bar
         print(f"✓ {self.operation_id} completed in {self._format_time(report.elapsed_time)}")
         
@@ -416,23 +568,23 @@ class ProgressTracker:
         """Format time duration."""
         if seconds < 60:
             return f"{seconds:.1f}s"
-        elif seconds < 3600:
-            minutes = int(seconds // 60)
-            secs = seconds % 60
-            return f"{minutes}m {secs:.0f}s"
-        else:
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            return f"{hours}h {minutes}m"
+        
+        minutes, secs = divmod(seconds, 60)
+        if seconds < 3600:
+            return f"{int(minutes)}m {secs:.0f}s"
+        
+        hours, minutes = divmod(int(minutes), 60)
+        return f"{hours}h {minutes}m"
     
     @staticmethod
     def _format_bytes(bytes_count: float) -> str:
         """Format byte count with appropriate units."""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_count < 1024.0:
-                return f"{bytes_count:.1f}{unit}"
-            bytes_count /= 1024.0
-        return f"{bytes_count:.1f}PB"
+        if bytes_count < 1024.0:
+            return f"{bytes_count:.1f}B"
+        
+        # Every 10 bits is one unit step; anything past PB stays in PB
+        unit_index = min((int(bytes_count).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+        return f"{bytes_count / (1 << (10 * unit_index)):.1f}{_BYTE_UNITS[unit_index]}"
 
 
 class MultiProgressTracker:
@@ -451,22 +603,30 @@ class MultiProgressTracker:
         """
         self.update_interval = update_interval
         self._trackers: Dict[str, ProgressTracker] = {}
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
         self._callbacks: List[Callable[[Dict[str, ProgressReport]], None]] = []
         
-        # Background update thread
+        # Background update thread, woken by tracker reports. Consolidated
+        # reports are skipped while no tracker's version has changed.
         self._update_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        self._dirty = threading.Condition()
+        self._reported_versions: Dict[str, int] = {}
     
     def add_tracker(self, tracker: ProgressTracker) -> None:
         """Add a progress tracker to monitor."""
         with self._lock:
             self._trackers[tracker.operation_id] = tracker
+            tracker._listeners.append(self._wake)
+        self._wake()
     
     def remove_tracker(self, operation_id: str) -> None:
         """Remove a progress tracker."""
         with self._lock:
-            self._trackers.pop(operation_id, None)
+            tracker = self._trackers.pop(operation_id, None)
+            if tracker is not None and self._wake in tracker._listeners:
+                tracker._listeners.remove(self._wake)
+        self._wake()
     
     def add_callback(self, callback: Callable[[Dict[str, ProgressReport]], None]) -> None:
         """Add callback for consolidated progress updates."""
@@ -485,6 +645,7 @@ class MultiProgressTracker:
     def stop_monitoring(self) -> None:
         """Stop background monitoring."""
         self._stop_event.set()
+        self._wake()
         if self._update_thread:
             self._update_thread.join(timeout=1.0)
     
@@ -496,19 +657,43 @@ class MultiProgressTracker:
                 for op_id, tracker in self._trackers.items()
             }
     
+    def _wake(self) -> None:
+        """Wake the monitoring thread after a tracker reported progress."""
+        with self._dirty:
+            self._dirty.notify()
+    
     def _monitor_loop(self) -> None:
         """Background monitoring loop."""
-        while not self._stop_event.wait(self.update_interval):
+        last_report_time = 0.0
+        while True:
+            # Wake on a tracker report, or after update_interval to pick up
+            # updates that did not report, but never report more often
+            with self._dirty:
+                self._dirty.wait(self.update_interval)
+            remaining = last_report_time + self.update_interval - time.monotonic()
+            if remaining > 0:
+                self._stop_event.wait(remaining)
+            if self._stop_event.is_set():
+                break
+            
             try:
+                with self._lock:
+                    versions = {op_id: tracker._version for op_id, tracker in self._trackers.items()}
+                if versions == self._reported_versions:
+                    continue
+                self._reported_versions = versions
+                last_report_time = time.monotonic()
+                
                 reports = self.get_consolidated_report()
                 
-                # Notify all callbacks
+                # Notify all callbacks, outside the lock so they may use the tracker
                 with self._lock:
-                    for callback in self._callbacks:
-                        try:
-                            callback(reports)
-                        except Exception as e:
-                            print(f"Error in progress callback: {e}", file=sys.stderr)
+                    callbacks = list(self._callbacks)
+                for callback in callbacks:
+                    try:
+                        callback(reports)
+                    except Exception as e:
+                        print(f"Error in progress callback: {e}", file=sys.stderr)
                             
             except Exception as e:
                 print(f"Error in progress monitoring: {e}", file=sys.stderr)
@@ -0,0 +1,114 @@
+"""
+Test suite for the backup extraction engine
+"""
+import os
+import sys
+import tarfile
+import zipfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extraction_engine import ExtractionEngine, RATIO_CHECK_MIN_SIZE, SecurityError
+
+ZERO_FILE_SIZE = 64 * 1024 * 1024
+
+
+def write_zero_file(path):
+    """Write a zero-filled file, the most compressible payload there is"""
+    with open(path, 'wb') as f:
+        f.truncate(ZERO_FILE_SIZE)
+    return path
+
+
+class TestCompressionRatio:
+    """Test the decompression bomb checks against benign archives"""
+    
+    @pytest.fixture
+    def engine(self, tmp_path):
+        """Engine with its temp dirs under the test's tmp_path"""
+        with ExtractionEngine(temp_base_dir=tmp_path) as engine:
+            yield engine
+    
+    def test_zero_filled_tar_gz_extracts(self, engine, tmp_path):
+        """A small tar.gz of zeros expands over 1000:1 but is not a bomb"""
+        source = write_zero_file(tmp_path / 'segment.bin')
+        archive = tmp_path / 'backup.tar.gz'
+        with tarfile.open(archive, 'w:gz') as tar:
+            tar.add(source, arcname='segment.bin')
+        
+        result = engine.test_extraction(archive)
+        
+        assert result.success, result.error_message
+        assert result.file_count == 1
+        assert result.total_size == ZERO_FILE_SIZE
+    
+    def test_zero_filled_zip_extracts(self, engine, tmp_path):
+        """A small zip of zeros expands over 1000:1 but is not a bomb"""
+        source = write_zero_file(tmp_path / 'segment.bin')
+        archive = tmp_path / 'backup.zip'
+        with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.write(source, arcname='segment.bin')
+        
+        result = engine.test_extraction(archive)
+        
+        assert result.success, result.error_message
+        assert result.file_count == 1
+        assert os.path.getsize(os.path.join(result.extraction_path, 'segment.bin')) == ZERO_FILE_SIZE
+    
+    def test_ratio_enforced_past_minimum_size(self, tmp_path):
+        """Large expansions over the configured ratio are still rejected"""
+        engine = ExtractionEngine(temp_base_dir=tmp_path, max_compression_ratio=10)
+        
+        engine._check_extraction_budget(RATIO_CHECK_MIN_SIZE, 1024)
+        with pytest.raises(SecurityError):
+            engine._check_extraction_budget(RATIO_CHECK_MIN_SIZE + 1, RATIO_CHECK_MIN_SIZE // 100)
+
+
+class TestSymlinkEscape:
+    """Test that members cannot be written through symlinks from the same archive"""
+    
+    @pytest.mark.parametrize('concurrency', [1, 4])
+    def test_member_below_escaping_symlink_rejected(self, tmp_path, concurrency):
+        """s -> outside followed by s/pwn is rejected in serial and parallel mode"""
+        outside = tmp_path / 'outside'
+        payload = tmp_path / 'payload'
+        payload.write_bytes(b'pwned')
+        archive = tmp_path / 'backup.tar'
+        with tarfile.open(archive, 'w') as tar:
+            link = tarfile.TarInfo('s')
+            link.type = tarfile.SYMTYPE
+            link.linkname = str(outside)
+            tar.addfile(link)
+            tar.add(payload, arcname='s/pwn')
+        
+        with ExtractionEngine(temp_base_dir=tmp_path, extract_concurrency=concurrency) as engine:
+            result = engine.test_extraction(archive)
+            root = result.extraction_path
+            
+            assert os.path.islink(os.path.join(root, 's'))
+            assert not os.path.lexists(os.path.join(root, 's', 'pwn'))
+            assert not outside.exists()
+            assert "Skipped unsafe path: s/pwn" in result.metadata.warnings
+    
+    @pytest.mark.parametrize('concurrency', [1, 4])
+    def test_file_replaced_by_escaping_symlink_not_written_through(self, tmp_path, concurrency):
+        """x followed by x -> outside/file never writes x's data outside the root"""
+        outside = tmp_path / 'outside'
+        outside.mkdir()
+        payload = tmp_path / 'payload'
+        payload.write_bytes(b'pwned' * 1024)
+        archive = tmp_path / 'backup.tar'
+        with tarfile.open(archive, 'w') as tar:
+            tar.add(payload, arcname='x')
+            link = tarfile.TarInfo('x')
+            link.type = tarfile.SYMTYPE
+            link.linkname = str(outside / 'file')
+            tar.addfile(link)
+        
+        with ExtractionEngine(temp_base_dir=tmp_path, extract_concurrency=concurrency) as engine:
+            result = engine.test_extraction(archive)
+            
+            assert os.path.islink(os.path.join(result.extraction_path, 'x'))
+            assert not (outside / 'file').exists()
@@ -8,14 +8,51 @@ import sys
 import json
 import time
 import asyncio
+import resource
 import statistics
+from pathlib import Path
 from typing import List, Dict, Any
 
-# Add the dgm module to Python path
-sys.path.insert(0, '/mnt/c/Users/jehma/Desktop/AI/DGMSTT')
+# Make the dgm package next to this script importable
+ROOT = Path(__file__).resolve().parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
 
 from dgm.bridge.stdio_server import DGMBridgeSTDIOServer, Message
 
+# Run in a fresh interpreter so startup includes interpreter init and imports
+STARTUP_SCRIPT = """
+import asyncio
+from dgm.bridge.stdio_server import DGMBridgeSTDIOServer, Message
+server = DGMBridgeSTDIOServer()
+asyncio.run(server.send_message(Message(
+    id='init',
+    type='event',
+    method='server.started',
+    params={'version': '1.0'}
+)))
+"""
+
+def rss_mb() -> float:
+    """Current resident set size of this process in MB"""
+    try:
+        # Second field of statm is resident pages; no psutil needed on Linux
+        with open('/proc/self/statm') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * resource.getpagesize() / (1024 * 1024)
+    except OSError:
+        # Without /proc fall back to peak RSS, which only ever grows
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in KB elsewhere
+        return max_rss / (1024 * 1024) if sys.platform == 'darwin' else max_rss / 1024
+
+def percentile(sorted_times: List[float], pct: int) -> float:
+    """Interpolated percentile of pre-sorted samples, matching statistics.quantiles"""
+    n = len(sorted_times)
+    j = min(max(pct * (n + 1) // 100, 1), n - 1)
+    fraction = (pct * (n + 1) - j * 100) / 100
+    return sorted_times[j - 1] + (sorted_times[j] - sorted_times[j - 1]) * fraction
+
 class BridgePerformanceTester:
     def __init__(self):
         self.server = DGMBridgeSTDIOServer()
@@ -25,22 +62,37 @@ class BridgePerformanceTester:
             'tools_list': [],
             'tool_execute': []
         }
+        self.throughput: Dict[str, float] = {}
     
     async def measure_operation(self, operation_name: str, message: Message, iterations: int = 100):
         """Measure the latency of a single operation"""
-        times = []
+        times_ns = [0] * iterations
+        responses = 0
         
         for _ in range(iterations):
-            start_time = time.perf_counter()
+            start_ns = time.perf_counter_ns()
             response = await self.server.handle_message(message)
-            end_time = time.perf_counter()
+            elapsed_ns = time.perf_counter_ns() - start_ns
             
             if response:
-                times.append((end_time - start_time) * 1000)  # Convert to ms
+                times_ns[responses] = elapsed_ns
+                responses += 1
         
+        # Convert to ms outside the timed loop
+        times = [t / 1_000_000 for t in times_ns[:responses]]
         self.results[operation_name] = times
         return times
     
+    async def measure_throughput(self, operation_name: str, message: Message, iterations: int = 100) -> float:
+        """Measure requests per second with all requests in flight at once"""
+        start_ns = time.perf_counter_ns()
+        await asyncio.gather(*[self.server.handle_message(message) for _ in range(iterations)])
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        
+        throughput = iterations * 1_000_000_000 / elapsed_ns
+        self.throughput[operation_name] = throughput
+        return throughput
+    
     async def run_benchmarks(self):
         """Run all performance benchmarks"""
         print("=== DGM Bridge Performance Test ===\n")
@@ -98,12 +150,15 @@ class BridgePerformanceTester:
             if not times:
                 continue
                 
-            avg_time = statistics.mean(times)
-            min_time = min(times)
-            max_time = max(times)
-            p50 = statistics.median(times)
-            p95 = statistics.quantiles(times, n=20)[18] if len(times) > 20 else max_time
-            p99 = statistics.quantiles(times, n=100)[98] if len(times) > 100 else max_time
+            # Sort once and read every order statistic from the sorted list
+            sorted_times = sorted(times)
+            n = len(sorted_times)
+            avg_time = sum(sorted_times) / n
+            min_time = sorted_times[0]
+            max_time = sorted_times[-1]
+            p50 = (sorted_times[(n - 1) // 2] + sorted_times[n // 2]) / 2
+            p95 = percentile(sorted_times, 95) if n > 20 else max_time
+            p99 = percentile(sorted_times, 99) if n > 100 else max_time
             
             status = "✅ PASSED" if avg_time < 100 else "❌ FAILED"
             
@@ -117,38 +172,41 @@ class BridgePerformanceTester:
             print()
     
     async def test_startup_time(self):
-        """Test server initialization time"""
+        """Test server startup time in a new process"""
         print("\nTesting startup time...")
         
         times = []
         for i in range(5):
-            start_time = time.perf_counter()
-            server = DGMBridgeSTDIOServer()
-            # Simulate initialization
-            await server.send_message(Message(
-                id='init',
-                type='event',
-                method='server.started',
-                params={'version': '1.0'}
-            ))
-            end_time = time.perf_counter()
-            times.append((end_time - start_time) * 1000)
+            start_ns = time.perf_counter_ns()
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, '-c', STARTUP_SCRIPT,
+                cwd=str(ROOT),
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.DEVNULL
+            )
+            returncode = await process.wait()
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            
+            if returncode != 0:
+                print(f"  Iteration {i+1}: server failed to start (exit code {returncode})")
+                continue
             
+            times.append(elapsed_ns / 1_000_000)
             print(f"  Iteration {i+1}: {times[-1]:.2f}ms")
         
+        if not times:
+            print("\n❌ FAILED Server did not start; run with python -X importtime to diagnose")
+            return
+        
         avg_startup = statistics.mean(times)
         status = "✅ PASSED" if avg_startup < 2000 else "❌ FAILED"
         print(f"\n{status} Average startup time: {avg_startup:.2f}ms (target: <2000ms)")
     
     async def test_memory_overhead(self):
         """Test memory usage"""
-        import psutil
-        import os
-        
         print("\nTesting memory overhead...")
         
-        process = psutil.Process(os.getpid())
-        baseline_memory = process.memory_info().rss / 1024 / 1024  # MB
+        baseline_memory = rss_mb()
         
         # Create server and perform operations
         server = DGMBridgeSTDIOServer()
@@ -160,7 +218,7 @@ class BridgePerformanceTester:
             )
             await server.handle_message(msg)
         
-        current_memory = process.memory_info().rss / 1024 / 1024  # MB
+        current_memory = rss_mb()
         memory_increase = current_memory - baseline_memory
         
         status = "✅ PASSED" if memory_increase < 50 else "❌ FAILED"
@@ -186,6 +244,17 @@ async def main():
     avg_latencies = {op: statistics.mean(times) for op, times in tester.results.items() if times}
     overall_avg = statistics.mean(avg_latencies.values())
     
+    # Compare concurrent throughput against back-to-back requests
+    concurrent = await tester.measure_throughput('health', Message(
+        id="throughput-test",
+        type="request",
+        method="health"
+    ))
+    sequential = 1000 / avg_latencies['health'] if avg_latencies.get('health') else 0.0
+    print(f"- Health throughput: {concurrent:.0f} req/s concurrent vs {sequential:.0f} req/s sequential")
+    if concurrent < sequential * 1.5:
+        print("- Concurrent requests barely overlap; consider handling messages concurrently in the server")
+    
     if overall_avg > 50:
         print("- Consider implementing connection pooling for Python processes")
         print("- Investigate using MessagePack instead of JSON for serialization")
@@ -3,6 +3,11 @@ import sys
 import os
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Print Python environment info
 info = {
     "python_executable": sys.executable,
@@ -21,4 +26,11 @@ try:
 except ImportError as e:
     info["import_error"] = str(e)
 
-print(json.dumps(info, indent=2))
\ No newline at end of file
+# Indent for people at a terminal; emit compact JSON for tools reading a pipe
+if orjson is not None:
+    options = orjson.OPT_INDENT_2 if sys.stdout.isatty() else 0
+    print(orjson.dumps(info, option=options).decode())
+elif sys.stdout.isatty():
+    print(json.dumps(info, indent=2))
+else:
+    print(json.dumps(info, separators=(',', ':')))
\ No newline at end of file